@@ -15,7 +15,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import (
     TypeAlias, TypeVar, Generic, 
-    List, Any, 
+    List, Any, Callable, Dict, 
     Protocol, runtime_checkable,
     Union, overload,
     TYPE_CHECKING
@@ -49,11 +49,13 @@ T_   = TypeVar("T_", covariant=True)   # valor “otro” en operaciones binaria
 @runtime_checkable
 class SupportsValue(Protocol[T_co]):
     """Cualquier objeto que exponga .value."""
+    __slots__ = ()
     @property
     def value(self) -> T_co: ...
 
 @runtime_checkable
 class Addable(SupportsValue[T], Protocol[T]):
+    __slots__ = ()
     def __add__(self, other: Addable[T]) -> Algebraic[T]: ...
     def __neg__(self) -> Algebraic[T]: ...
     def __sub__(self, other: Addable[T]) -> Algebraic[T]: ...
@@ -61,6 +63,7 @@ class Addable(SupportsValue[T], Protocol[T]):
 
 @runtime_checkable
 class Multiplyable(SupportsValue[T_co], Protocol[T_co]):
+    __slots__ = ()
     def __mul__( self, other: Union[ScalarLike, Multiplyable[Any]]) -> Algebraic[Any]: ...
     def __rmul__(self, other: ScalarLike) -> Algebraic[Any]: ...
 
@@ -154,6 +157,12 @@ class AlgebraicOps:
         _validate_same_dim(a, b)
         return [[x + y for x, y in zip(ra, rb)] for ra, rb in zip(a, b)]
 
+    # --- Resta --------------------------------------------------------------
+    @staticmethod
+    def sub_vector_like(a: VectorLike, b: VectorLike) -> VectorLike:
+        _validate_same_len(a, b)
+        return [x - y for x, y in zip(a, b)]
+
     # --- Producto -----------------------------------------------------------
     @staticmethod
     def mul_scalar_like(a: ScalarLike, b: ScalarLike) -> ScalarLike:
@@ -167,6 +176,12 @@ class AlgebraicOps:
     def mul_matrix_scalar_like(M: MatrixLike, k: ScalarLike) -> MatrixLike:
         return [[x * k for x in row] for row in M]
 
+    @staticmethod
+    def axpy_like(a: VectorLike, alpha: ScalarLike, b: VectorLike) -> VectorLike:
+        """alpha·a + b en una sola pasada (sin la lista intermedia alpha·a)."""
+        _validate_same_len(a, b)
+        return [alpha * x + y for x, y in zip(a, b)]
+
     @staticmethod
     def st_dot(a: VectorLike, b: VectorLike) -> ScalarLike:
         _validate_same_len(a, b)
@@ -223,14 +238,35 @@ def T2Algebraic(val: VectorLike) -> Vector: ...
 @overload
 def T2Algebraic(val: MatrixLike) -> Matrix: ...
 
+# type(val) -> conversor; se rellena en el primer uso de cada tipo (mismo
+# esquema que Scalar._mul_dispatch). Para las secuencias se guarda el
+# conversor genérico: si es vector o matriz depende del contenido.
+_T2ALG_DISPATCH: Dict[type, Callable[[Any], Any]] = {}
+
 def T2Algebraic(val: object): # type: ignore[overload]
     """
-    Convierte cualquier representación literal (nativo Python) a
+    Convierte cualquier representación literal (nativo Python) a
     Scalar | Vector | Matrix.  Evita dependencias inversas.
     """
-    from ..structures import Scalar, Vector, Matrix   # import local p/ romper ciclos
+    fn = _T2ALG_DISPATCH.get(type(val))
+    if fn is not None:
+        return fn(val)
+    return _T2Algebraic_slow(val)
+
+def _T2Algebraic_slow(val: object) -> Any:
+    """Resuelve el conversor para type(val) y lo memoriza en _T2ALG_DISPATCH."""
+    from ..structures import Scalar   # import local p/ romper ciclos
     if isinstance(val, ScalarLike):
-        return Scalar(val)
+        fn: Callable[[Any], Any] = Scalar
+    elif isinstance(val, Sequence):
+        fn = _sequence_to_algebraic
+    else:
+        raise TypeError(f"Tipo no soportado: {val.__class__.__name__!s}")
+    _T2ALG_DISPATCH[type(val)] = fn
+    return fn(val)
+
+def _sequence_to_algebraic(val: Any) -> Any:
+    from ..structures import Vector, Matrix   # import local p/ romper ciclos
     if _is_vector(val):
         return Vector(list(val))                   # type: ignore 
     if _is_matrix(val):
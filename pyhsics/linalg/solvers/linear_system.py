@@ -11,6 +11,10 @@ from pyhsics.linalg.structures import Vector, Matrix
 
 from pyhsics.printing.core import LINEAR_SYS_FORMATTING_MODES as MODES
 
+# Un término de un lado de la ecuación: signo, coeficiente y variable
+# opcionales ("-2.5*x", "+y", "3"). Se aplica en posiciones consecutivas.
+_TERM_RE = re.compile(r'([+-]?)(\d*\.?\d*)(?:\*?([A-Za-z]\w*))?')
+
 
 def vector_to_integer_coords(vec_float: Union[Vector,VectorLike]):
     """
@@ -245,17 +249,22 @@ class LinearSystem(Printable):
 
         # 3) Definir parser de un lado a diccionario var->coef y "_const"
         def parse_side(expr: str) -> Dict[str, float]:
-            expr = expr.replace('-', '+-')
-            terms = [t for t in expr.replace(' ', '').split('+') if t]
+            # Una sola pasada: cada término empieza donde acabó el anterior
+            # (sin las copias de replace('-', '+-') + split('+'))
+            expr = expr.replace(' ', '')
             data: Dict[str, float] = {v: 0.0 for v in variables}
             data['_const'] = 0.0
-            term_pat = re.compile(r'^([+-]?\d*\.?\d*)(?:\*?([A-Za-z]\w*))?$')
-            for term in terms:
-                m = term_pat.match(term)
-                if not m:
-                    raise ValueError(f"Término inválido: '{term}'")
-                coef_str, var_str = m.groups()
-                coef = float(coef_str) if coef_str not in ('', '+', '-') else (1.0 if coef_str != '-' else -1.0)
+            pos, end = 0, len(expr)
+            while pos < end:
+                m = _TERM_RE.match(expr, pos)
+                # Sin avance, o un término que no empieza por signo: inválido
+                if m is None or m.end() == pos or (pos and not m.group(1)):
+                    raise ValueError(f"Término inválido: '{expr[pos:]}'")
+                sign, num, var_str = m.groups()
+                pos = m.end()
+                if not num and not var_str and sign == '+':
+                    continue                              # '+' suelto: término vacío
+                coef = float(sign + num) if num else (-1.0 if sign == '-' else 1.0)
                 if var_str:
                     data[var_str] = data.get(var_str, 0.0) + coef
                 else:
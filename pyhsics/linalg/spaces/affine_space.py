@@ -1,8 +1,9 @@
 from pyhsics.linalg.spaces.vector_space import VectorSpace
-from pyhsics.linalg.structures import Point, Vector
+from pyhsics.linalg.structures import Point, Vector, VectorBatch
 from pyhsics.printing.printable import Printable
 
 
+from itertools import count
 from typing import List, Optional, overload
 
 
@@ -10,8 +11,8 @@ class AffineSpace(Printable):
     """
     Representa un espacio afín S = p + V, donde p es un punto en ℝ^n y V un VectorSpace.
     """
-    _typical_names = iter(["S", "T", "R", "Q", "P"])
-    _typical_names_iter = iter(_typical_names)
+    _NAMES = ("S", "T", "R", "Q", "P")
+    _counter = count()
 
     def __init__(self,
                  point: Point,
@@ -23,7 +24,7 @@ class AffineSpace(Printable):
             self._vs = VectorSpace(name=(name or "\\vec{S}"))
         self.point = point
         self.dimension = self._vs.dimension
-        self.name = name or next(self._typical_names_iter)
+        self.name = name or self._NAMES[next(self._counter) % len(self._NAMES)]
 
     @classmethod
     def from_points(cls, *points: Point, name: Optional[str] = None) -> "AffineSpace":
@@ -31,7 +32,10 @@ class AffineSpace(Printable):
         Crea un espacio afín a partir de uno o más puntos.
         Usa el primer punto para definir el espacio afín.
         """
-        vectors = [p - points[0] for p in points[1:]]
+        if len(points) < 2:
+            return cls(points[0], name=name)
+        # Todas las diferencias p_i - p_0 en una sola resta vectorizada
+        vectors = VectorBatch.from_vectors(points[1:]) - points[0]
         return cls(points[0], *vectors, name=name)
 
     @property
@@ -1,21 +1,35 @@
-from typing import Optional, List, Tuple, overload, Union
+from typing import Optional, List, Tuple, overload, Union, TYPE_CHECKING
 from collections import OrderedDict
+from itertools import count
+
+import numpy as np
 
-from pyhsics.linalg.spaces.affine_space import AffineSpace
 from pyhsics.printing.printable import Printable
-from pyhsics.linalg.structures import Vector, Point
+from pyhsics.linalg.structures import Vector, Point, Matrix
+
+if TYPE_CHECKING:
+    from pyhsics.linalg.spaces.affine_space import AffineSpace
+
+
+def _rank(rows: List[List]) -> int:
+    """
+    Rango de los vectores (como filas). Con componentes numéricas se apilan
+    en un ndarray y se usa np.linalg.matrix_rank (SVD de LAPACK); si hay
+    alguna simbólica se recurre a la eliminación exacta de Matrix.
+    """
+    arr = np.array(rows)
+    if arr.dtype.kind in "biufc":
+        return int(np.linalg.matrix_rank(arr))
+    return Matrix(rows).rank()
 
-# Asumiendo que Vector y sus métodos ya están implementados:
-# Vector.are_linear_dependent(vectors: List[Vector]) -> bool
-# Vector supports +, -, scalar multiplication, equality, zero vector via Vector.zero(dim)
-# y que Vector.__len__ retorna la dimensión.
 
 class VectorSpace(Printable):
     """
     Representa un espacio vectorial V ⊆ ℝ^n generado por un conjunto de vectores independientes.
     """
-    _typical_names = iter(["V", "W", "U", "S", "T", "R", "Q", "P"])
-    _typical_names_iter = iter(_typical_names)
+    _NAMES = ("V", "W", "U", "S", "T", "R", "Q", "P")
+    _counter = count()
+
     def __init__(self,
                  *generators: "Vector",
                  name: Optional[str] = None):
@@ -24,16 +38,18 @@ class VectorSpace(Printable):
         else:
             # Filtrar un conjunto independiente y en orden
             basis: List["Vector"] = []
+            rows: List[List] = []
             for v in generators:
                 if v.is_zero():
                     continue
-                if set(v, *basis) == set(basis):
+                if _rank([*rows, v.value]) == len(rows):
                     # v es combinación lineal de los generadores
                     continue
                 basis.append(v)
+                rows.append(v.value)
             self.directions = basis
         self.dimension = len(self.directions)
-        self.name = next(self._typical_names_iter) if name is None else name
+        self.name = self._NAMES[next(self._counter) % len(self._NAMES)] if name is None else name
 
     @property
     def nullspace(cls) -> "VectorSpace":
@@ -46,7 +62,7 @@ class VectorSpace(Printable):
         """
         if vec.is_zero():
             return True
-        return set(vec, *self.directions) == set(self.directions)
+        return _rank([*(v.value for v in self.directions), vec.value]) == self.dimension
     
     def __len__(self) -> int:
         """
@@ -62,11 +78,11 @@ class VectorSpace(Printable):
     def __add__(self, other: Point) -> "AffineSpace": ...
     
     def __add__(self, other):
+        from pyhsics.linalg.spaces.affine_space import AffineSpace
         if isinstance(other, Vector):
             # Trasladamos el espacio a un espacio afín
-            from copy import deepcopy
-            return AffineSpace(point=other,
-                               *deepcopy(self.directions),
+            return AffineSpace(other,
+                               *self.directions,
                                name=f"{self.name}+p")
         elif isinstance(other, VectorSpace):
             # Minkowski sum: span(dirs1 ∪ dirs2)
@@ -74,9 +90,8 @@ class VectorSpace(Printable):
                                name=f"{self.name}+{other.name}")
         elif isinstance(other, Point):
             # Trasladamos el espacio a un espacio afín
-            from copy import deepcopy
-            return AffineSpace(point=other,
-                               *deepcopy(self.directions),
+            return AffineSpace(other,
+                               *self.directions,
                                name=f"{self.name}+p")
         else:
             return NotImplemented
@@ -86,12 +101,12 @@ class VectorSpace(Printable):
     @overload
     def __sub__(self, other: "VectorSpace") -> "VectorSpace": ...
     def __sub__(self, other):
+        from pyhsics.linalg.spaces.affine_space import AffineSpace
         if isinstance(other, Vector):
             # Traslación inversa
-            from copy import deepcopy
             p = -other
-            return AffineSpace(point=p,
-                               *deepcopy(self.directions),
+            return AffineSpace(p,
+                               *self.directions,
                                name=f"{self.name}-p")
         elif isinstance(other, VectorSpace):
             # Diferencias de espacios: span(dirs1 ∪ dirs2)
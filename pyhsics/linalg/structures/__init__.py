@@ -1,11 +1,18 @@
 from pyhsics.linalg.structures.scalar import Scalar
 from pyhsics.linalg.structures.vector import Vector
 from pyhsics.linalg.structures.point import Point
+from pyhsics.linalg.structures.vector_batch import VectorBatch
 from pyhsics.linalg.structures.matrix.matrix import Matrix
+from pyhsics.linalg.structures.vector import _bind_late_refs
+from pyhsics.linalg.structures.point import _bind_late_refs as _bind_point_refs
+
+_bind_late_refs()
+_bind_point_refs()
 
 __all__ = [
     'Scalar',
     'Vector',
     'Point',
-    'Matrix'
+    'Matrix',
+    'VectorBatch'
 ]
\ No newline at end of file
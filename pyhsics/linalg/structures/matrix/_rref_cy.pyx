@@ -0,0 +1,64 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# _rref_cy.pyx  ----------------------------------------------------------
+# Núcleo Gauss-Jordan de MatrixMethods compilado con Cython.
+# -------------------------------------------------------------------------
+#  • Extensión opcional: setup.py sólo la compila si Cython está
+#    disponible; si no, MatrixMethods usa Numba o NumPy.
+#  • Mismo algoritmo que `_rref_kernel` (matrix_methods_numba.py):
+#    pivoteo parcial, in situ sobre un ndarray float64 C-contiguo.
+#  • El bucle interno B[r, c] -= f * B[pr, c] es un AXPY de paso 1 que
+#    el compilador puede vectorizar.
+# -------------------------------------------------------------------------
+
+import numpy as np
+from libc.math cimport fabs
+
+# Igual que PIVOT_RTOL en matrix_methods_numba.py: un pivote con
+# |p| <= PIVOT_RTOL · max|columna original| es residuo de redondeo.
+cdef double PIVOT_RTOL = 1e-10
+
+
+def rref_f64(double[:, ::1] B):
+    """Gauss-Jordan con pivoteo parcial sobre B (n×m, float64), in situ."""
+    cdef Py_ssize_t n = B.shape[0], m = B.shape[1]
+    cdef Py_ssize_t pr = 0, pc, r, c, k
+    cdef double piv, best, f, tmp
+    cdef double[::1] tol = np.zeros(m)
+
+    for c in range(m):
+        for r in range(n):
+            if fabs(B[r, c]) > tol[c]:
+                tol[c] = fabs(B[r, c])
+        tol[c] *= PIVOT_RTOL
+
+    for pc in range(m):
+        if pr >= n:
+            break
+        k = pr
+        best = fabs(B[pr, pc])
+        for r in range(pr + 1, n):
+            if fabs(B[r, pc]) > best:
+                best = fabs(B[r, pc])
+                k = r
+        if best <= tol[pc]:
+            for r in range(pr, n):
+                B[r, pc] = 0.0
+            continue
+        if k != pr:
+            for c in range(pc, m):
+                tmp = B[pr, c]
+                B[pr, c] = B[k, c]
+                B[k, c] = tmp
+        piv = 1.0 / B[pr, pc]
+        for c in range(pc + 1, m):
+            B[pr, c] *= piv
+        B[pr, pc] = 1.0         # x · (1/x) no siempre da 1 exacto
+        for r in range(n):
+            if r == pr:
+                continue
+            f = B[r, pc]
+            if f != 0.0:
+                for c in range(pc + 1, m):
+                    B[r, c] -= f * B[pr, c]
+                B[r, pc] = 0.0
+        pr += 1
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Iterable, List, Literal, Optional, Self, SupportsIndex, Tuple, Union, overload
 
 from pyhsics.linalg.core.algebraic_core import Addable, Algebraic, AlgebraicOps, MatrixLike, Multiplyable, round_T_Scalar, ScalarLike
@@ -13,6 +13,23 @@ from pyhsics.linalg.structures.matrix.matrix_core import MatrixCore
 def _same_shape(a: MatrixLike, b: MatrixLike) -> bool:
     return len(a) == len(b) and len(a[0]) == len(b[0])
 
+@lru_cache(maxsize=64)
+def _eye_rows(n: int) -> Tuple[Tuple[int, ...], ...]:
+    """Filas inmutables de la identidad n×n (se construyen una vez por n)."""
+    return tuple(tuple(1 if i == j else 0 for j in range(n)) for i in range(n))
+
+
+def _pow_by_squaring(M: MatrixLike, n: int) -> MatrixLike:
+    """M**n (n >= 0) con O(log n) productos: cuadrado y multiplicación."""
+    mul = AlgebraicOps.mul_mat_mat_like
+    result: Optional[MatrixLike] = None
+    while n:
+        if n & 1:
+            result = M if result is None else mul(result, M)
+        n >>= 1
+        if n:
+            M = mul(M, M)
+    return result if result is not None else [list(r) for r in _eye_rows(len(M))]
 
 
 class Matrix(
@@ -23,14 +40,12 @@ class Matrix(
     """Matriz densa de dimensión arbitraria."""
     
     def __eq__(self, other: object) -> bool:
-        from .matrix import Matrix
         if isinstance(other, Matrix):
-            return self._rows_tuple == other._rows_tuple
+            return self._value == other._value
         return False
-    
-    def __hash__(self) -> int:
-        """Hash de la matriz."""
-        return hash(tuple(tuple(row) for row in self._value))
+
+    # Definir __eq__ anula el __hash__ heredado: se reexpone el de MatrixCore
+    __hash__ = MatrixCore.__hash__
 
     # ---------- helpers internos ------------------------------------
     @cached_property
@@ -82,9 +97,6 @@ class Matrix(
     def __mul__(self, other: Matrix)   -> Matrix: ...
 
     def __mul__(self, other):                           # type: ignore[override]
-        from ..scalar import Scalar
-        from ..vector import Vector
-        from ..point import Point
 
         # --- caso escalar literal --------------------------------------------
         if isinstance(other, ScalarLike):
@@ -98,6 +110,11 @@ class Matrix(
         if isinstance(other, Point):
             return Point(AlgebraicOps.mul_mat_vec_like(self._value, other.value))
         if isinstance(other, Matrix):
+            if self._all_float and other._all_float:
+                # Producto float64 con NumPy sobre las copias en caché
+                if self.shape[1] != other.shape[0]:
+                    raise ValueError("Dimensiones incompatibles")
+                return Matrix((self._array @ other._array).tolist())
             return Matrix(AlgebraicOps.mul_mat_mat_like(self._value, other._value))
 
         return NotImplemented
@@ -113,7 +130,6 @@ class Matrix(
     def __truediv__(self, other: Scalar)     -> Matrix: ...
 
     def __truediv__(self, other):                      # type: ignore[override]
-        from ..scalar import Scalar
         if isinstance(other, ScalarLike):
             other = Scalar(other)
         if not isinstance(other, Scalar):
@@ -129,10 +145,15 @@ class Matrix(
     def __pow__(self, exp: Scalar)          -> Matrix: ...
 
     def __pow__(self, exp)                  -> Matrix:  # type: ignore[override]
-        # Si exp no es un entero menor de 10 -> diagonalizar la matriz 
-        # y elevar los terminos de la diagonal. Luego volver a la base 
-        # original.
-        return NotImplemented
+        n = exp.value if isinstance(exp, Scalar) else exp
+        if isinstance(n, bool) or not isinstance(n, int):
+            # Exponente no entero -> diagonalizar la matriz y elevar los
+            # terminos de la diagonal. Luego volver a la base original.
+            return NotImplemented
+        if not self.is_squared:
+            raise ValueError("Sólo se pueden elevar matrices cuadradas.")
+        base = self if n >= 0 else self.inv()
+        return Matrix(_pow_by_squaring(base._value, abs(n)))
 
     # ---------------------------------------------------------------------
     # 4  Operaciones matriciales clásicas ----------------------------------
@@ -192,7 +213,6 @@ class Matrix(
     # TODO: Implementar esto en LinearMap
     def ker(self) -> Union[Vector, List[Vector], None]:
         from ...solvers.linear_system import LinearSystem
-        from ..vector import Vector
         return LinearSystem(self, Vector.zeros(self.shape[0])).solve()
 
     def _to_upper_triangular_similarity(self) -> Tuple['Matrix','Matrix']:
@@ -238,18 +258,16 @@ class Matrix(
         prod = 1
         for i in range(self.shape[0]):
             prod *= B.value[i][i]
-        from ..scalar import Scalar
         return Scalar(prod)
 
     @classmethod
     def eye(cls, n: int) -> Matrix:
-        return cls([[1 if i == j else 0 for j in range(n)] for i in range(n)])
+        return cls(_eye_rows(n))
 
     def row(self, n: int) -> Vector:
         return self[n]
 
     def col(self, n: SupportsIndex) -> Vector:
-        from ..vector import Vector
         return Vector([row[n] for row in self.value])
 
     def __round__(self, n: int = 2) -> Matrix:
@@ -275,7 +293,6 @@ class Matrix(
         """Calcula la traza de la matriz."""
         if not self.is_squared:
             raise ValueError("La traza solo está definida para matrices cuadradas.")
-        from ..scalar import Scalar
         return Scalar(sum(self.value[i][i] for i in range(self.shape[0])))
 
     @property
@@ -284,9 +301,11 @@ class Matrix(
         return n == m
 
     def is_high_triang(self) -> bool:
-        for i, row in enumerate(self):
-            for j, e in enumerate(row):
-                if j <= i and not Scalar(e).is_zero():
+        # Comparación directa con 0 (lo mismo que Scalar.is_zero) y sólo
+        # sobre las columnas j <= i, sin crear un Scalar por entrada.
+        for i, row in enumerate(self._value):
+            for e in row[:i + 1]:
+                if e != 0:
                     return False
         return True
 
@@ -314,7 +333,6 @@ class Matrix(
 
     def hstack(self, other: Union[Matrix, Vector]) -> Matrix:
         """Apila horizontalmente (a la drecha) dos matrices."""
-        from ..vector import Vector
         if isinstance(other, Vector):
             other = Matrix([other.value]).T
         if self.shape[0] != other.shape[0]:
@@ -323,7 +341,6 @@ class Matrix(
 
     def vstack(self, other: Union[Matrix, Vector]) -> Matrix:
         """Apila verticalmente (debajo) dos matrices."""
-        from ..vector import Vector
         if isinstance(other, Vector):
             other = Matrix([other.value])
         if self.shape[1] != other.shape[1]:
@@ -332,8 +349,8 @@ class Matrix(
 
     def _augmented_matrix_I(self) -> Matrix:
         """Devuelve la matriz aumentada [A|I]"""
-        I = Matrix.eye(self.shape[0])
-        return Matrix([row + I_row for row, I_row in zip(self.value, I.value)])
+        I = _eye_rows(self.shape[0])
+        return Matrix([[*row, *I_row] for row, I_row in zip(self._value, I)])
 
     def inv(self) -> Matrix:
         if self.rank() != self.shape[0]:
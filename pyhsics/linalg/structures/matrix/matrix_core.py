@@ -1,4 +1,7 @@
-from typing import Iterable, Iterator, List, Tuple
+from functools import cached_property
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 from pyhsics.linalg.core.algebraic_core import Algebraic, MatrixLike, ScalarLike
 from pyhsics.linalg.structures import Vector
@@ -21,14 +24,40 @@ class MatrixCore(Algebraic[MatrixLike]):
             raise ValueError("Todas las filas deben tener la misma longitud.")
         super().__init__(matrix)
 
-        # ➊  Representación hashable para cache
-        self._rows_tuple: tuple[tuple[ScalarLike, ...], ...] = tuple(
-            tuple(r) for r in matrix
-        )
-
     # Opcional, útil para dict / set
     def __hash__(self) -> int:
-        return hash(self._rows_tuple)
+        return self._hash
+
+    @cached_property
+    def _hash(self) -> int:
+        # La tupla de filas sólo se construye si la matriz llega a hashearse
+        return hash(tuple(tuple(r) for r in self._value))
+
+    @cached_property
+    def _array(self) -> Optional[np.ndarray]:
+        """
+        Copia contigua (float64 / complex128, sólo lectura) de las entradas,
+        o None si alguna no es numérica. Se construye en el primer uso y la
+        reutilizan todos los caminos numéricos de MatrixMethods.
+        """
+        arr = np.array(self._value)
+        if arr.dtype.kind in "iuf":
+            arr = arr.astype(np.float64)
+        elif arr.dtype.kind == "c":
+            arr = arr.astype(np.complex128)
+        else:
+            return None
+        arr.flags.writeable = False
+        return arr
+
+    @cached_property
+    def _all_float(self) -> bool:
+        """
+        True si todas las entradas son float: entonces un producto hecho con
+        NumPy devuelve los mismos tipos que el bucle Python (ints y complex
+        se quedan en el camino genérico).
+        """
+        return all(type(x) is float for row in self._value for x in row)
 
     # ---------------- propiedades básicas ---------------------------------
     @property
@@ -37,15 +66,23 @@ class MatrixCore(Algebraic[MatrixLike]):
         return _dims(self._value)
 
     def is_zero(self) -> bool:
-        return all(x == 0 for row in self._value for x in row)
+        for row in self._value:
+            for x in row:
+                if x != 0:
+                    return False
+        return True
 
     def is_identity(self) -> bool:
         n, m = self.shape
         if n != m:
             return False
-        return all(
-            self._value[i][j] == (1 if i == j else 0) for i in range(n) for j in range(m)
-        )
+        for i, row in enumerate(self._value):
+            if row[i] != 1:
+                return False
+            for j, x in enumerate(row):
+                if x != 0 and j != i:
+                    return False
+        return True
 
     # ---------------- indexación / iter -----------------------------------
     def __getitem__(self, idx: int) -> Vector:
@@ -1,4 +1,85 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
 from pyhsics.linalg.structures import Scalar, Matrix
+from pyhsics.linalg.structures.matrix.matrix_methods_numba import (
+    _rref_f64, _rref_f64_parallel, PARALLEL_MIN_ROWS, PIVOT_RTOL
+)
+
+try:  # extensión Cython opcional (ver setup.py)
+    from pyhsics.linalg.structures.matrix._rref_cy import rref_f64 as _rref_f64_cy  # type: ignore
+except ImportError:
+    _rref_f64_cy = None
+
+
+def _to_ndarray(A: Matrix) -> Optional[np.ndarray]:
+    """
+    Copia escribible de `A._array` (float64/complex128) para los núcleos que
+    trabajan in situ. Devuelve None si hay entradas simbólicas (o enteros
+    que no caben en 64 bits), en cuyo caso se usa el camino genérico.
+    """
+    arr = A._array
+    return None if arr is None else arr.copy()
+
+
+def _pivot_tol(B: np.ndarray) -> np.ndarray:
+    """Umbral de pivote por columna, relativo a su máximo |·| original."""
+    return PIVOT_RTOL * np.abs(B).max(axis=0) if B.size else np.zeros(B.shape[1])
+
+
+def _ref_numeric(B: np.ndarray, normalize: bool = True) -> Tuple[np.ndarray, int]:
+    """
+    Eliminación gaussiana in situ con pivoteo parcial (GEPP).
+    Con `normalize` cada fila pivote queda normalizada a 1; sin él, B
+    termina siendo el factor U de PA = LU. Devuelve (B, nº de intercambios).
+    """
+    n, m = B.shape
+    tol = _pivot_tol(B)
+    swaps = 0
+    for i in range(min(n, m)):
+        k = i + int(np.argmax(np.abs(B[i:, i])))
+        if abs(B[k, i]) <= tol[i]:
+            B[i:, i] = 0        # residuo de redondeo: columna sin pivote
+            continue
+        if k != i:
+            B[[i, k]] = B[[k, i]]
+            swaps += 1
+        if normalize:
+            B[i, i:] /= B[i, i]
+            B[i+1:, i:] -= B[i+1:, i:i+1] * B[i, i:]
+        else:
+            B[i+1:, i:] -= (B[i+1:, i:i+1] / B[i, i]) * B[i, i:]
+    return B, swaps
+
+
+def _rref_numeric(B: np.ndarray) -> np.ndarray:
+    """
+    Gauss-Jordan in situ con pivoteo parcial, vectorizado por filas.
+    Respaldo de `_rref_f64` cuando Numba no está disponible o B es complejo.
+    """
+    n, m = B.shape
+    tol = _pivot_tol(B)
+    pr = 0
+    for pc in range(m):
+        if pr >= n:
+            break
+        k = pr + int(np.argmax(np.abs(B[pr:, pc])))
+        if abs(B[k, pc]) <= tol[pc]:
+            B[pr:, pc] = 0      # residuo de redondeo: columna sin pivote
+            continue
+        if k != pr:
+            B[[pr, k]] = B[[k, pr]]
+        # Fila pivote escalada una sola vez; cada otra fila se actualiza con
+        # un único multiply-sub contra ella (sin copia de factores ni pasar
+        # por la propia fila pivote).
+        row = B[pr, pc:] / B[pr, pc]
+        B[pr, pc:] = row
+        B[:pr, pc:] -= B[:pr, pc:pc+1] * row
+        B[pr+1:, pc:] -= B[pr+1:, pc:pc+1] * row
+        pr += 1
+    return B
+
 
 class MatrixMethods:
     @classmethod
@@ -7,6 +88,11 @@ class MatrixMethods:
         if A.shape[0] != A.shape[1]:
             raise ValueError("El determinante solo está definido para matrices cuadradas.")
 
+        arr = _to_ndarray(A)
+        if arr is not None:
+            U, swaps = _ref_numeric(arr, normalize=False)
+            return Scalar((-1) ** swaps * np.prod(np.diag(U)).item())
+
         M = cls.row_echelon_form(A).value
         det = 1
         for i in range(len(M)):
@@ -15,10 +101,16 @@ class MatrixMethods:
 
     @classmethod
     def transpose(cls, A: Matrix) -> Matrix:
-        return Matrix([[A[j][i] for j in range(len(A))] for i in range(len(A[0]))])
+        # zip(*filas) recorre cada fila una vez, de forma contigua y a nivel C
+        return Matrix(zip(*A.value))
 
     @classmethod
     def row_echelon_form(cls, A: Matrix) -> Matrix:
+        arr = _to_ndarray(A)
+        if arr is not None:
+            B_num, _ = _ref_numeric(arr)
+            return Matrix(B_num.tolist())
+
         B = [fila[:] for fila in A]
         n = len(B)
         m = len(B[0]) if n > 0 else 0
@@ -32,16 +124,76 @@ class MatrixMethods:
             if B[i][i] == 0:
                 continue
 
-            pivote = B[i][i]
+            fila_i = B[i]                       # local: evita B[i] por celda
+            pivote = fila_i[i]
             for j in range(i, m):
-                B[i][j] /= pivote
+                fila_i[j] /= pivote
 
             for k in range(i + 1, n):
-                factor = B[k][i]
+                fila_k = B[k]
+                factor = fila_k[i]
+                if factor == 0:
+                    continue
                 for j in range(i, m):
-                    B[k][j] -= factor * B[i][j]
+                    fila_k[j] -= factor * fila_i[j]
         return Matrix(B)
 
+    @classmethod
+    def rref_batched(cls, A: np.ndarray) -> np.ndarray:
+        """
+        Forma reducida por filas de una pila de matrices de igual forma.
+
+        `A` tiene forma (B, n, m); se aplica Gauss-Jordan a las B matrices a
+        la vez, de modo que el bucle Python recorre sólo las m columnas y no
+        cada matriz. Cada matriz lleva su propia fila pivote `p`: en las que
+        no tienen pivote en una columna, esa columna se salta sin tocarlas.
+        Retorna un nuevo ndarray (no muta A).
+        """
+        arr = np.asarray(A)
+        if arr.ndim != 3:
+            raise ValueError("rref_batched espera un array de forma (B, n, m).")
+        dtype = np.complex128 if arr.dtype.kind == "c" else np.float64
+        R = arr.astype(dtype)
+        nb, n, m = R.shape
+
+        p = np.zeros(nb, dtype=np.intp)       # fila pivote de cada matriz
+        rows = np.arange(n)
+        # Umbral de pivote por matriz y columna, como en _pivot_tol
+        tol = PIVOT_RTOL * np.abs(R).max(axis=1) if R.size else np.zeros((nb, m))
+        for j in range(m):
+            col = np.abs(R[:, :, j])
+            below = rows >= p[:, None]
+            # Candidatas: filas >= p cuya entrada supera el umbral (los
+            # residuos de redondeo no cuentan como pivote)
+            cand = below & (col > tol[:, j, None])
+            has_pivot = cand.any(axis=1)
+            # Matrices sin pivote en j: se limpian sus residuos
+            R[:, :, j][below & ~has_pivot[:, None]] = 0
+            if not has_pivot.any():
+                continue
+            idx = np.flatnonzero(has_pivot)
+            k = np.arange(idx.size)
+            pr = p[idx]
+            # Pivoteo parcial: mayor |a_rj| entre las candidatas
+            i = np.argmax(np.where(cand[idx], col[idx], -1.0), axis=1)
+
+            # Intercambio de filas pr <-> i
+            tmp = R[idx, pr].copy()
+            R[idx, pr] = R[idx, i]
+            R[idx, i] = tmp
+
+            # Normalización y eliminación en el resto de filas
+            R[idx, pr] /= R[idx, pr, j][:, None]
+            factors = R[idx, :, j].copy()
+            factors[k, pr] = 0
+            R[idx] -= factors[:, :, None] * R[idx, pr][:, None, :]
+            # Pivote y columna eliminada exactos (sin residuo de x·(1/x))
+            R[idx, :, j] = 0
+            R[idx, pr, j] = 1
+
+            p[idx] += 1
+        return R
+
     @classmethod
     def reduced_row_echelon_form(cls, A: Matrix) -> Matrix:
         """
@@ -50,6 +202,21 @@ class MatrixMethods:
         procedimiento de Gauss-Jordan. 
         Retorna una nueva matriz (no muta A).
         """
+        arr = _to_ndarray(A)
+        if arr is not None:
+            # Núcleo compilado para float64: Numba paralelo en matrices
+            # grandes, si no Cython y luego Numba; si no hay, NumPy.
+            f64 = arr.dtype == np.float64
+            if f64 and _rref_f64_parallel is not None and arr.shape[0] >= PARALLEL_MIN_ROWS:
+                _rref_f64_parallel(arr)
+            elif f64 and _rref_f64_cy is not None:
+                _rref_f64_cy(arr)
+            elif f64 and _rref_f64 is not None:
+                _rref_f64(arr)
+            else:
+                _rref_numeric(arr)
+            return Matrix(arr.tolist())
+
         # 1) Copiar la matriz original para trabajar sobre la copia
         B = [fila[:] for fila in A.value]
 
@@ -78,21 +245,26 @@ class MatrixMethods:
 
             # 3) Hacer que el pivote sea 1.
             #    pivot := B[pivot_row][pivot_col]
-            pivot = B[pivot_row][pivot_col]
+            #    Las filas se guardan en locales (pr_row, r_row) para no
+            #    repetir B[...] en cada celda del bucle interno.
+            pr_row = B[pivot_row]
+            pivot = pr_row[pivot_col]
             #    Dividimos toda la fila por 'pivot'
             #    (en simbólico: multiplicamos por inv(pivot))
             inv_pivot = 1/(pivot)   # inverso simbólico
             for c in range(pivot_col, m):
-                B[pivot_row][c] = (B[pivot_row][c] *  inv_pivot)
+                pr_row[c] = pr_row[c] * inv_pivot
 
             # 4) Eliminar la columna pivot_col en todas las demás filas
             for r in range(n):
-                if r != pivot_row:
-                    factor = B[r][pivot_col]
-                    if not (factor) == 0:
-                        # Queremos B[r] := B[r] - factor * B[pivot_row]
-                        for c in range(pivot_col, m):
-                            B[r][c] = (B[r][c] - (factor * B[pivot_row][c]))
+                if r == pivot_row:
+                    continue
+                r_row = B[r]
+                factor = r_row[pivot_col]
+                if not (factor) == 0:
+                    # Queremos B[r] := B[r] - factor * B[pivot_row]
+                    for c in range(pivot_col, m):
+                        r_row[c] = r_row[c] - factor * pr_row[c]
 
             pivot_row += 1
             pivot_col += 1
@@ -0,0 +1,76 @@
+# matrix_methods_numba.py  -----------------------------------------------
+# Núcleos numéricos de MatrixMethods compilados con Numba.
+# -------------------------------------------------------------------------
+#  • Numba es opcional: si no está instalado, `_rref_f64` vale None y
+#    MatrixMethods usa la versión vectorizada con NumPy.
+#  • Los núcleos trabajan in situ sobre un ndarray float64 contiguo.
+#  • La variante paralela reparte las filas a eliminar entre hilos; el
+#    número de hilos lo fija NUMBA_NUM_THREADS.
+# -------------------------------------------------------------------------
+
+from typing import Callable, Optional
+
+import numpy as np
+
+try:
+    from numba import njit, prange  # type: ignore
+except ImportError:
+    njit = None
+    prange = range
+
+# Por debajo de este número de filas el coste de lanzar hilos en cada
+# columna supera lo que se gana repartiendo la eliminación.
+PARALLEL_MIN_ROWS = 256
+
+# Un candidato a pivote con |p| <= PIVOT_RTOL · max|columna original| es
+# residuo de redondeo (1e-16 en una matriz singular de enteros), no un
+# pivote: la columna se anula. Misma escala que el 1e-10 de Matrix.rank().
+PIVOT_RTOL = 1e-10
+
+
+def _rref_kernel(B: np.ndarray) -> None:
+    """Gauss-Jordan con pivoteo parcial sobre B (n×m, float64), in situ."""
+    n, m = B.shape
+    tol = np.empty(m)
+    for c in range(m):
+        tol[c] = PIVOT_RTOL * np.max(np.abs(B[:, c])) if n else 0.0
+    pr = 0
+    for pc in range(m):
+        if pr >= n:
+            break
+        k = pr + np.argmax(np.abs(B[pr:, pc]))
+        if abs(B[k, pc]) <= tol[pc]:
+            for r in range(pr, n):
+                B[r, pc] = 0.0
+            continue
+        if k != pr:
+            for c in range(pc, m):
+                B[pr, c], B[k, c] = B[k, c], B[pr, c]
+        inv = 1.0 / B[pr, pc]
+        for c in range(pc + 1, m):
+            B[pr, c] *= inv
+        # x · (1/x) no siempre da 1 exacto: la columna pivote se fija a mano
+        # para no dejar residuos f·ε en las demás filas
+        B[pr, pc] = 1.0
+        # Cada fila r sólo escribe en sí misma y lee la fila pivote:
+        # las iteraciones son independientes y se pueden repartir (prange).
+        for r in prange(n):
+            if r == pr:
+                continue
+            f = B[r, pc]
+            if f != 0.0:
+                for c in range(pc + 1, m):
+                    B[r, c] -= f * B[pr, c]
+                B[r, pc] = 0.0
+        pr += 1
+
+
+_rref_f64: Optional[Callable[[np.ndarray], None]] = (
+    njit(cache=True, fastmath=True)(_rref_kernel) if njit is not None else None
+)
+
+# Sin cache: el índice de caché de Numba no distingue `parallel` y
+# chocaría con el de la variante secuencial, que comparte función.
+_rref_f64_parallel: Optional[Callable[[np.ndarray], None]] = (
+    njit(parallel=True, fastmath=True)(_rref_kernel) if njit is not None else None
+)
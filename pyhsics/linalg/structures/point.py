@@ -5,27 +5,26 @@ from typing import Optional, overload, TYPE_CHECKING
 from ..core.algebraic_core import (
     Addable, Multiplyable, 
     ScalarLike, VectorLike,
-    AlgebraicOps, round_T_Scalar
+    round_T_Scalar
 )
 
-from .vector import VectorCore
+from .scalar import Scalar
+from .vector import Vector, VectorCore, _add, _sub, _mul_vs, _div_vs, _mul_mv
 
 if TYPE_CHECKING:                       # — tipos sólo para el checker
-    from .scalar import Scalar
     from .matrix.matrix import Matrix
-    from .vector import Vector
 
 
 class Point(VectorCore, Addable[VectorLike], Multiplyable[VectorLike]):
+    __slots__ = ()
+
     def is_identity(self) -> bool:
         return False
     
     def __str__(self) -> str: # TODO
-        from .matrix.matrix import Matrix
         return str(Matrix([self._value]))
     
     def _repr_latex_(self, name: Optional[str] = None) -> str: # TODO
-        from .matrix.matrix import Matrix
         return f'${Matrix([self._value]).latex()}$'
 
     @overload
@@ -36,14 +35,12 @@ class Point(VectorCore, Addable[VectorLike], Multiplyable[VectorLike]):
     def __mul__(self, other: Matrix)     -> Point: ...
     
     def __mul__(self, other): # type: ignore
-        from .scalar import Scalar                        
-        from .matrix.matrix import Matrix                      
         if isinstance(other, ScalarLike):
             other = Scalar(other)
         if isinstance(other, Scalar):
-            return Point(AlgebraicOps.mul_vector_scalar_like(self._value, other.value))
+            return Point._wrap(_mul_vs(self._value, other.value))
         if isinstance(other, Matrix):
-            return Point(AlgebraicOps.mul_mat_vec_like(other.value, self._value))
+            return Point._wrap(_mul_mv(other.value, self._value))
         return NotImplemented
 
     def __rmul__(self, other: ScalarLike) -> Point:
@@ -55,22 +52,20 @@ class Point(VectorCore, Addable[VectorLike], Multiplyable[VectorLike]):
     def __add__(self, other: Vector) -> Point: ...
     
     def __add__(self, other: Addable[VectorLike]):
-        from .vector import Vector
         if isinstance(other, Point):
-            return Point(AlgebraicOps.add_vector_like(self._value, other.value))
+            return Point._wrap(_add(self._value, other.value))
         if isinstance(other, Vector):
-            return Point(AlgebraicOps.add_vector_like(self._value, other.value))
+            return Point._wrap(_add(self._value, other.value))
         raise NotImplementedError
     
     def __neg__(self) -> Point:
-        return Point([-x for x in self._value])
+        return Point._wrap([-x for x in self._value])
 
     def __sub__(self, other: Addable[VectorLike]) -> Vector:
-        from .vector import Vector
-        return Vector(AlgebraicOps.add_vector_like((-other).value, self._value))
+        return Vector._wrap(_sub(self._value, other.value))
 
     def __round__(self, ndigits: int = 2) -> Point:
-        return Point(round_T_Scalar(v, ndigits) for v in self)
+        return Point._wrap([round_T_Scalar(v, ndigits) for v in self._value])
 
     @overload
     def __truediv__(self, other: ScalarLike) -> Point:
@@ -80,13 +75,21 @@ class Point(VectorCore, Addable[VectorLike], Multiplyable[VectorLike]):
         ...
 
     def __truediv__(self, other): # type: ignore[override]
-        from .scalar import Scalar                        
         if isinstance(other, ScalarLike):
             other = Scalar(other)
         if isinstance(other, Scalar):
-            return Point(AlgebraicOps.div_vector_scalar_like(self._value, other.value))
+            return Point._wrap(_div_vs(self._value, other.value))
         return NotImplemented
 
     def vector(self) -> Vector:
-        from .vector import Vector
         return Vector(self._value)
+
+
+def _bind_late_refs() -> None:
+    """
+    Enlaza Matrix como global del módulo: matrix.py importa este, así que
+    no puede importarse arriba. Lo llama structures/__init__ cuando ya
+    están cargados, y los métodos se ahorran el `import` local.
+    """
+    global Matrix
+    from .matrix.matrix import Matrix
@@ -12,8 +12,7 @@
 
 from __future__ import annotations
 
-from math import isclose
-from typing import Any, Optional, overload, TYPE_CHECKING
+from typing import Any, Callable, ClassVar, Dict, Optional, overload, TYPE_CHECKING
 
 from ..core.algebraic_core import (
     Addable, Multiplyable,
@@ -35,10 +34,25 @@ class Scalar(
 ):
     """Número escalar exacto (int, float, complex)."""
 
+    # type(other) -> manejador de __mul__; se rellena en el primer uso de
+    # cada tipo (los imports de Vector / Matrix no pueden ir a nivel de
+    # módulo por ciclos).
+    _mul_dispatch: ClassVar[Dict[type, Callable[[Scalar, Any], Any]]] = {}
+
     # ------------- init ------------------------------------------------
     def __init__(self, value: ScalarLike) -> None:
         super().__init__(value)
 
+    @classmethod
+    def _wrap(cls, value: ScalarLike) -> Scalar:
+        """
+        Constructor interno: guarda `value` sin pasar por la cadena de
+        __init__. Para los Scalar que devuelven los accesos de Vector.
+        """
+        new = cls.__new__(cls)
+        new._value = value
+        return new
+
     # ------------- representación -------------------------------------
     def __str__(self) -> str:            # str(s)
         from ...printing.printer_alg import LinAlgTextFormatter
@@ -50,7 +64,9 @@ class Scalar(
 
     # ------------- helpers de Algebraic -------------------------------
     def is_zero(self) -> bool:
-        return isclose(abs(self._value), 0.0, abs_tol=0.0)
+        # isclose(..., abs_tol=0.0) contra 0 sólo acepta el cero exacto;
+        # la comparación directa da lo mismo (también para complex).
+        return self._value == 0
 
     def is_identity(self) -> bool:
         return self._value == 1
@@ -75,18 +91,29 @@ class Scalar(
     def __mul__(self, other: Multiplyable[MatrixLike]) -> Matrix: ...
     
     def __mul__(self, other):  # type: ignore[override]
+        fn = Scalar._mul_dispatch.get(type(other))
+        if fn is not None:
+            return fn(self, other)
+        return self._mul_slow(other)
+
+    def _mul_slow(self, other: Any) -> Any:
+        """Resuelve el manejador para type(other) y lo memoriza en _mul_dispatch."""
         from .vector import Vector
         from .matrix.matrix import Matrix
         if isinstance(other, ScalarLike):
-            other = Scalar(other)
-        if isinstance(other, Scalar):
-            return Scalar(AlgebraicOps.mul_scalar_like(self._value, other._value))
-        if isinstance(other, Vector):
-            return Vector(AlgebraicOps.mul_vector_scalar_like(other.value, self._value))
-        if isinstance(other, Matrix):
-            return Matrix(AlgebraicOps.mul_matrix_scalar_like(other.value, self._value))
+            fn = _mul_raw
+        elif isinstance(other, Scalar):
+            fn = _mul_scalar
+        elif isinstance(other, Vector):
+            def fn(s: Scalar, v: Vector) -> Vector:
+                return Vector(AlgebraicOps.mul_vector_scalar_like(v.value, s._value))
+        elif isinstance(other, Matrix):
+            def fn(s: Scalar, M: Matrix) -> Matrix:
+                return Matrix(AlgebraicOps.mul_matrix_scalar_like(M.value, s._value))
         else:
             return NotImplemented
+        Scalar._mul_dispatch[type(other)] = fn
+        return fn(self, other)
 
     __rmul__ = __mul__
 
@@ -124,8 +151,30 @@ class Scalar(
             exp_val = exp
         else:
             raise TypeError(f'El exponente debe ser un escalar.')
+        # Sólo bases int: con float los productos desenrollados pueden
+        # diferir de pow() en el último bit, y con SymPy o bool `**` ya da
+        # el tipo correcto
+        if type(exp_val) is int and 0 <= exp_val < 8 and type(self._value) is int:
+            return self._pow_small_int(exp_val)
         return Scalar(self._value ** exp_val)
 
+    def _pow_small_int(self, n: int) -> Scalar:
+        """Potencias enteras 0 ≤ n < 8 de una base int con productos desenrollados."""
+        v = self._value
+        if n == 0:
+            return Scalar(1)
+        if n == 1:
+            return self
+        v2 = v * v
+        match n:
+            case 2: r = v2
+            case 3: r = v2 * v
+            case 4: r = v2 * v2
+            case 5: r = v2 * v2 * v
+            case 6: r = v2 * v2 * v2
+            case _: r = v2 * v2 * v2 * v
+        return Scalar(r)
+
     # ------------- coerciones Python ----------------------------------
     def __float__(self) -> float:
         return float(self._value.real if isinstance(self.value, complex) else self.value)
@@ -139,3 +188,14 @@ class Scalar(
     def __abs__(self) -> Scalar: 
         return Scalar(abs(self._value))
     # ------------- igualdad / orden ya los aporta Algebraic -----------
+
+
+# ---------------------------------------------------------------------
+# 2.  Manejadores de Scalar.__mul__ (Vector / Matrix se crean en
+#     _mul_slow, donde ya están importados)
+# ---------------------------------------------------------------------
+def _mul_raw(s: Scalar, other: ScalarLike) -> Scalar:
+    return Scalar(AlgebraicOps.mul_scalar_like(s._value, other))
+
+def _mul_scalar(s: Scalar, other: Scalar) -> Scalar:
+    return Scalar(AlgebraicOps.mul_scalar_like(s._value, other._value))
@@ -8,20 +8,74 @@
 
 from __future__ import annotations
 
+from math import sqrt
+from numbers import Number
 from random import random, gauss
 from typing import (
-    Iterable, Iterator, List, Optional,
+    Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Optional, Tuple, Union,
     overload, TYPE_CHECKING
 )
 
+import numpy as np
+
 from ..core.algebraic_core import (
     Addable, Multiplyable,
     Algebraic, ScalarLike, VectorLike,
     AlgebraicOps, round_T_Scalar
 )
 
+from .scalar import Scalar
+from .vector_numba import _bilinear_f64, _dot_parallel_f64, _PARALLEL_MIN_LEN
+
+# Operaciones de AlgebraicOps ligadas a nombres de módulo: los operadores
+# de Vector / Point se ahorran el LOAD_ATTR sobre la clase en cada llamada
+_add = AlgebraicOps.add_vector_like
+_sub = AlgebraicOps.sub_vector_like
+_mul_vs = AlgebraicOps.mul_vector_scalar_like
+_div_vs = AlgebraicOps.div_vector_scalar_like
+_mul_mv = AlgebraicOps.mul_mat_vec_like
+_axpy = AlgebraicOps.axpy_like
+
+
+# Núcleos sin bucle para dimensiones pequeñas, generados una sola vez por
+# dimensión (como hacen dataclasses/attrs): con pocas componentes el coste
+# de zip + comprensión domina sobre la propia aritmética
+_UNROLL_MAX = 8
+_UNROLLED: Dict[int, Tuple[Callable[..., VectorLike], ...]] = {}
+
+
+def _unrolled(n: int) -> Tuple[Callable[..., VectorLike], ...]:
+    """(add, sub, scale, dot) en línea recta para vectores de dimensión n."""
+    kernels = _UNROLLED.get(n)
+    if kernels is None:
+        a = "".join(f"a{i}, " for i in range(n))
+        b = "".join(f"b{i}, " for i in range(n))
+        src = (
+            f"def add(a, b):\n    {a}= a\n    {b}= b\n"
+            f"    return [{', '.join(f'a{i} + b{i}' for i in range(n))}]\n"
+            f"def sub(a, b):\n    {a}= a\n    {b}= b\n"
+            f"    return [{', '.join(f'a{i} - b{i}' for i in range(n))}]\n"
+            f"def scale(a, k):\n    {a}= a\n"
+            f"    return [{', '.join(f'a{i} * k' for i in range(n))}]\n"
+            f"def dot(a, b):\n    {a}= a\n    {b}= b\n"
+            f"    return {' + '.join(f'a{i} * b{i}' for i in range(n))}\n"
+        )
+        ns: Dict[str, Any] = {}
+        exec(src, ns)
+        kernels = _UNROLLED[n] = (ns["add"], ns["sub"], ns["scale"], ns["dot"])
+    return kernels
+
+def _pivot(v: VectorLike) -> Optional[int]:
+    """Índice de la componente de mayor módulo (None si v está vacío)."""
+    return max(range(len(v)), key=lambda i: abs(v[i]), default=None)
+
+
+def _is_numeric(v: VectorLike) -> bool:
+    """True si todas las componentes son números (ordenables por módulo)."""
+    return all(isinstance(x, Number) for x in v)
+
+
 if TYPE_CHECKING:                       # — tipos sólo para el checker
-    from .scalar import Scalar
     from .matrix.matrix import Matrix
     from .point import Point
     
@@ -31,9 +85,35 @@ if TYPE_CHECKING:                       # — tipos sólo para el checker
 class VectorCore(Algebraic[VectorLike]):
     """Métodos utilitarios comunes; no exportes esta clase."""
 
+    # Sin __dict__: las cachés perezosas (_array, _all_float) viven en slots
+    __slots__ = ("_array_cache", "_all_float_cache")
+
+    # Por debajo de esta dimensión el bucle Python sobre la lista gana a
+    # NumPy (coste fijo de la llamada y de .tolist()).
+    _NUMPY_MIN_LEN: ClassVar[int] = 16
+
     # ---------------- init / iterable -------------------------------------
     def __init__(self, value: Iterable[ScalarLike]) -> None:
-        super().__init__(list(value))            # copia defensiva
+        if isinstance(value, np.ndarray):
+            # tolist() ya copia, y deja escalares Python (no np.float64)
+            super().__init__(value.tolist())
+        else:
+            super().__init__(list(value))        # copia defensiva
+
+    @classmethod
+    def _wrap(cls, value: List[ScalarLike]):
+        """
+        Constructor interno: adopta `value` tal cual, sin copiarlo. Sólo
+        para listas recién creadas que nadie más referencia.
+        """
+        new = cls.__new__(cls)
+        new._value = value
+        return new
+
+    def __getstate__(self):
+        # Sólo las componentes: las cachés (ndarray de sólo lectura, tipo de
+        # las componentes) se reconstruyen en el proceso que carga
+        return (None, {"_value": self._value})
 
     def __iter__(self) -> Iterator[ScalarLike]:
         return iter(self._value)
@@ -44,12 +124,53 @@ class VectorCore(Algebraic[VectorLike]):
     def __len__(self) -> int:
         return len(self._value)
 
+    @property
+    def _array(self) -> Optional[np.ndarray]:
+        """
+        Copia contigua (float64 / complex128, sólo lectura) de las componentes,
+        o None si alguna no es numérica. Se construye en el primer uso.
+        """
+        try:
+            return self._array_cache
+        except AttributeError:
+            arr: Optional[np.ndarray] = np.array(self._value)
+            if arr.dtype.kind in "iuf":
+                arr = arr.astype(np.float64)
+            elif arr.dtype.kind == "c":
+                arr = arr.astype(np.complex128)
+            else:
+                arr = None
+            if arr is not None:
+                arr.flags.writeable = False
+            self._array_cache = arr
+            return arr
+
+    @property
+    def _all_float(self) -> bool:
+        """
+        True si todas las componentes son float: entonces operar con NumPy
+        devuelve los mismos tipos que el bucle Python (ints y complex se
+        quedan en el camino genérico).
+        """
+        try:
+            return self._all_float_cache
+        except AttributeError:
+            flag = all(type(x) is float for x in self._value)
+            self._all_float_cache = flag
+            return flag
+
+    def _numpy_ok(self) -> bool:
+        """Vector float lo bastante largo como para que NumPy compense."""
+        return len(self._value) >= self._NUMPY_MIN_LEN and self._all_float
+
     # ---------------- helpers Algebraic -----------------------------------
+    # Recorridos en C sobre la lista (any / list.count) en lugar de un
+    # generador con una comparación Python por componente
     def is_zero(self) -> bool:
-        return all(x == 0 for x in self._value)
+        return not any(self._value)
 
     def is_identity(self) -> bool:
-        return all(x == 1 for x in self._value)
+        return self._value.count(1) == len(self._value)
     
     def __eq__(self, other: object) -> bool:
         if isinstance(other, VectorCore):
@@ -78,9 +199,17 @@ class Vector(
         if A.is_squared:
             cls._dot_product_matrix = A
 
+    @classmethod
+    def _from_array(cls, arr: np.ndarray) -> Vector:
+        """Vector a partir de un resultado float64 de NumPy; lo deja como su `_array`."""
+        new = cls._wrap(arr.tolist())
+        arr.flags.writeable = False
+        new._array_cache = arr
+        new._all_float_cache = True
+        return new
+
     @property
     def T(self):
-        from .matrix.matrix import Matrix
         return Matrix([self._value])
     
     # ---------------- representación --------------------------------------
@@ -100,13 +229,17 @@ class Vector(
     
     def __add__(self, other): # type: ignore[override]
         """Suma de vectores o vector + punto."""    
-        from .point import Point
         if not isinstance(other, VectorCore):
             return NotImplemented
         if isinstance(other, Vector):
-            return Vector(AlgebraicOps.add_vector_like(self._value, other._value))
+            n = len(self._value)
+            if 0 < n <= _UNROLL_MAX and n == len(other._value):
+                return Vector._wrap(_unrolled(n)[0](self._value, other._value))
+            if self._numpy_ok() and other._all_float and len(self) == len(other):
+                return Vector._from_array(self._array + other._array)
+            return Vector._wrap(_add(self._value, other._value))
         if isinstance(other, Point):
-            return Point(AlgebraicOps.add_vector_like(self._value, other._value))
+            return Point._wrap(_add(self._value, other._value))
 
     @overload
     def __sub__(self, other: Point) -> Point:   ...
@@ -115,10 +248,37 @@ class Vector(
     
     def __sub__(self, other): # type: ignore[override]
         """Resta de vectores o vector - punto."""
-        return self + (- other) # type: ignore[no-redef]
+        # Una sola pasada: sin construir el opuesto de `other` como intermedio
+        if not isinstance(other, VectorCore):
+            return NotImplemented
+        if isinstance(other, Vector):
+            n = len(self._value)
+            if 0 < n <= _UNROLL_MAX and n == len(other._value):
+                return Vector._wrap(_unrolled(n)[1](self._value, other._value))
+            if self._numpy_ok() and other._all_float and len(self) == len(other):
+                return Vector._from_array(self._array - other._array)
+            return Vector._wrap(_sub(self._value, other._value))
+        if isinstance(other, Point):
+            return Point._wrap(_sub(self._value, other._value))
+
+    def axpy(self, alpha: Union[ScalarLike, Scalar], other: Vector) -> Vector:
+        """
+        alpha·self + other en una sola operación: el paso típico de un
+        integrador (x + dt·v) sin crear el vector intermedio alpha·self.
+        """
+        if isinstance(alpha, Scalar):
+            alpha = alpha.value
+        if type(alpha) is float and self._numpy_ok() and other._all_float \
+                and len(self) == len(other):
+            buf = np.multiply(self._array, alpha)
+            np.add(buf, other._array, out=buf)
+            return Vector._from_array(buf)
+        return Vector._wrap(_axpy(self._value, alpha, other._value))
 
     def __neg__(self) -> Vector:
-        return Vector([-x for x in self._value])
+        if self._numpy_ok():
+            return Vector._from_array(-self._array)
+        return Vector._wrap([-x for x in self._value])
 
     # ------------- multiplicación  ---------------------------------------
     @overload
@@ -129,12 +289,16 @@ class Vector(
     def __mul__(self, other: Vector)     -> Scalar: ...
     
     def __mul__(self, other):                             # type: ignore[override]
-        from .scalar import Scalar                        
         if isinstance(other, ScalarLike):
             other = Scalar(other)
 
         if isinstance(other, Scalar):
-            return Vector(AlgebraicOps.mul_vector_scalar_like(self._value, other.value))
+            n = len(self._value)
+            if 0 < n <= _UNROLL_MAX:
+                return Vector._wrap(_unrolled(n)[2](self._value, other.value))
+            if type(other.value) is float and self._numpy_ok():
+                return Vector._from_array(self._array * other.value)
+            return Vector._wrap(_mul_vs(self._value, other.value))
 
         if isinstance(other, Vector):
             return self.dot(other)
@@ -151,12 +315,13 @@ class Vector(
     def __truediv__(self, other: Scalar)    -> Vector: ...
 
     def __truediv__(self, other):                           # type: ignore[override]
-        from .scalar import Scalar
         if isinstance(other, ScalarLike):
             other = Scalar(other)
 
         if isinstance(other, Scalar):
-            return Vector(AlgebraicOps.div_vector_scalar_like(self._value, other.value))
+            if type(other.value) is float and other.value != 0 and self._numpy_ok():
+                return Vector._from_array(self._array / other.value)
+            return Vector._wrap(_div_vs(self._value, other.value))
 
         raise TypeError("Un vector sólo se puede dividir por un escalar.")
 
@@ -167,34 +332,68 @@ class Vector(
     # ---------------------------------------------------------------------
     def dot(self, other: Vector, *, form: Optional[Matrix] = None) -> Scalar:
         """Producto punto usando forma bilineal opcional (identidad por defecto)."""
-        from .scalar import Scalar
-        from .matrix.matrix import Matrix
-
         if form is None:
-            if self.__class__._dot_product_matrix is None:
-                form = Matrix.eye(len(self))
-                self.__class__._dot_product_matrix = form
-            else:
-                form = self.__class__._dot_product_matrix
-        
-        if len(form.value) != len(self) or len(form.value[0]) != len(other):
+            form = self.__class__._dot_product_matrix
+        if form is None:
+            # Forma euclídea: reducción directa, sin construir la identidad
+            # (antes además quedaba fijada para una sola dimensión)
+            return Scalar._wrap(self._euclidean_dot(other))
+
+        #   w · (M·v):  M ha de ser len(w) × len(v)
+        if form.shape != (len(other), len(self)):
             raise ValueError("Dimensiones incompatibles en producto bilineal")
 
-        #   vᵀ · M · w  ==  (Mᵀ·v)·w
-        Mv = AlgebraicOps.mul_mat_vec_like(form.value, self._value)
-        return Scalar(AlgebraicOps.st_dot(Mv, other._value))
+        M = form._array
+        if (M is not None and M.dtype == np.float64
+                and self._all_float and other._all_float):
+            # Mismo cálculo en float64 sobre las copias en caché. El núcleo
+            # compilado gana al doble bucle Python ya en R² (el trabajo es
+            # O(n²)), así que no espera a _NUMPY_MIN_LEN
+            if _bilinear_f64 is not None:
+                return Scalar._wrap(_bilinear_f64(self._array, M, other._array))
+            if self._numpy_ok():
+                # gemv + dot en BLAS, sin pasar por objetos Python intermedios
+                return Scalar._wrap(float(other._array @ M @ self._array))
+
+        # Una sola pasada, sin materializar la lista M·v
+        v = self._value
+        return Scalar._wrap(sum(wi * sum(x * y for x, y in zip(row, v))
+                                for wi, row in zip(other._value, form.value)))
+
+    def _euclidean_dot(self, other: Vector) -> ScalarLike:
+        a, b = self._value, other._value
+        n = len(a)
+        if n != len(b):
+            raise ValueError("Dimensiones incompatibles en producto bilineal")
+        if 0 < n <= _UNROLL_MAX:
+            return _unrolled(n)[3](a, b)
+        if self._numpy_ok() and other._all_float:
+            if _dot_parallel_f64 is not None and len(a) >= _PARALLEL_MIN_LEN:
+                return float(_dot_parallel_f64(self._array, other._array))
+            return float(self._array @ other._array)
+        return sum(x * y for x, y in zip(a, b))
+
+    def _magnitude(self) -> float:
+        # |v·v| ya es real: math.sqrt directo, sin pasar por funcs.sqrt
+        # (comprobación de complejos + cadena de isinstance) ni por Scalar.__abs__.
+        # Sin forma fijada se reduce directamente (ddot para floats largos)
+        # y no se crea el Scalar intermedio del producto punto.
+        form = self.__class__._dot_product_matrix
+        if form is None:
+            return sqrt(abs(self._euclidean_dot(self)))
+        return sqrt(abs(self.dot(self, form=form).value))
 
     @property
     def magnitude(self) -> Scalar:
-        from ...funcs import sqrt
-        mag2 = abs(self.dot(self))
-        return sqrt(mag2)
+        return Scalar._wrap(self._magnitude())
 
     def norm(self) -> Vector:
-        mag = self.magnitude.value
+        mag = self._magnitude()
         if mag == 0:
             raise ValueError("No se puede normalizar un vector nulo.")
-        return Vector(AlgebraicOps.div_vector_scalar_like(self._value, mag))
+        if type(mag) is float and self._numpy_ok():
+            return Vector._from_array(self._array / mag)
+        return Vector._wrap(_div_vs(self._value, mag))
 
     # --- cross sólo para R³ ----------------------------------------------
     def cross(self, other: Vector) -> Vector:
@@ -202,7 +401,7 @@ class Vector(
             raise ValueError("El producto cruz sólo está definido en R³")
         a1, a2, a3 = self._value
         b1, b2, b3 = other._value
-        return Vector([a2 * b3 - a3 * b2,
+        return Vector._wrap([a2 * b3 - a3 * b2,
                        a3 * b1 - a1 * b3,
                        a1 * b2 - a2 * b1])
 
@@ -211,43 +410,58 @@ class Vector(
     # ---------------------------------------------------------------------
     @classmethod
     def zeros(cls, n: int = 3) -> Vector:
-        return cls([0] * n)
+        return cls._wrap([0] * n)
 
     @classmethod
     def ones(cls, n: int = 3) -> Vector:
-        return cls([1] * n)
+        return cls._wrap([1] * n)
 
     @classmethod
     def unit_vectors(cls, n: int = 3) -> List[Vector]:
-        return [cls([1 if i == j else 0 for j in range(n)]) for i in range(n)]
+        # Filas de la identidad memorizadas (las mismas que usa Matrix.eye);
+        # cada vector recibe su propia lista
+        return [cls._wrap(list(row)) for row in _eye_rows(n)]
 
+    # Siempre con el módulo `random` (sea cual sea n), para que
+    # random.seed(...) reproduzca tanto vectores cortos como largos
     @classmethod
     def rand(cls, n: int = 3) -> Vector:
-        return cls(random() for _ in range(n))
+        return cls._wrap([random() for _ in range(n)])
 
     @classmethod
     def randn(cls, n: int = 3) -> Vector:
-        return cls(gauss(0, 1) for _ in range(n))
+        return cls._wrap([gauss(0, 1) for _ in range(n)])
 
     # ---------------------------------------------------------------------
     # 5  Accesos cortos x, y, z -------------------------------------------
     # ---------------------------------------------------------------------
     @property
     def x(self) -> Scalar:
-        from .scalar import Scalar
-        return Scalar(self[0])
+        return Scalar._wrap(self._value[0])
 
     @property
     def y(self) -> Scalar:
-        from .scalar import Scalar
-        return Scalar(self[1])
+        return Scalar._wrap(self._value[1])
 
     @property
     def z(self) -> Scalar:
-        from .scalar import Scalar
-        if len(self) < 3:
+        return Scalar._wrap(self.zv)
+
+    # Variantes sin envolver en Scalar: la componente tal cual, sin crear
+    # objetos (para bucles de integración que leen componentes sin parar)
+    @property
+    def xv(self) -> ScalarLike:
+        return self._value[0]
+
+    @property
+    def yv(self) -> ScalarLike:
+        return self._value[1]
+
+    @property
+    def zv(self) -> ScalarLike:
+        if len(self._value) < 3:
             raise AttributeError("Vector de dimensión < 3 no tiene 'z'")
-        return Scalar(self[2])
+        return self._value[2]
 
     # ---------------------------------------------------------------------
     # 6  Igualdad con tolerancia / hash ------------------------------------
@@ -255,26 +469,71 @@ class Vector(
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Vector):
             return False
-        return not self.are_linear_indep(self, other)
+        return self._colinear(self, other)
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash(tuple(self.norm().value))
+        # Sólo la dimensión: __eq__ compara con tolerancia y el vector nulo es
+        # igual a cualquier otro, así que ninguna función de las componentes
+        # (dirección redondeada, pivote) respeta el contrato hash/eq; en
+        # empates de módulo el ruido de float movía el pivote y el hash.
+        # Los vectores de igual dimensión caen en el mismo cubo de un
+        # set/dict y se distinguen con __eq__.
+        return hash((Vector, len(self._value)))
 
     @classmethod
-    def are_linear_indep(cls, v1: Vector, v2: Vector) -> bool:
-        from .matrix.matrix import Matrix
-        return Matrix.from_vecs([v1, v2]).rank() == 2
+    def are_linear_indep(cls, v1: Vector, v2: Vector, *, tol: float = 1e-10) -> bool:
+        if len(v1) != len(v2):
+            raise ValueError("Todos los vectores deben tener la misma longitud.")
+        # _colinear usa el rango exacto si hay componentes simbólicas
+        return not cls._colinear(v1, v2, tol)
+
+    @staticmethod
+    def _colinear(v1: Vector, v2: Vector, tol: float = 1e-10) -> bool:
+        """
+        Dependencia lineal de dos vectores en O(n), sin construir la matriz
+        ni calcular su rango: se toma como pivote la componente de mayor
+        módulo de v1 y se comprueba que todos los menores 2×2
+        (v1ₖ·v2ⱼ − v1ⱼ·v2ₖ) se anulen. Con componentes simbólicas (sin
+        orden por módulo) se usa el rango exacto de la matriz.
+        """
+        a, b = v1._value, v2._value
+        if len(a) != len(b):
+            return False
+        if not (_is_numeric(a) and _is_numeric(b)):
+            return Matrix.from_vecs([v1, v2]).rank() < 2
+        k = _pivot(a)
+        if k is None or a[k] == 0:
+            return True  # v1 nulo: siempre dependientes
+        ak, bk = a[k], b[k]
+        # Tolerancia puramente relativa a la escala de los menores (|v1|∞·|v2|∞),
+        # sin suelo absoluto: la colinealidad no depende de las unidades
+        scale = abs(ak) * max(abs(x) for x in b)
+        return all(abs(ak * bj - aj * bk) <= tol * scale for aj, bj in zip(a, b))
     
     def __round__(self, ndigits: int = 2) -> Vector:
-        return Vector(round_T_Scalar(v, ndigits) for v in self)
+        return Vector._wrap([round_T_Scalar(v, ndigits) for v in self._value])
     
     @classmethod
     def unit_vecs(cls, n: int = 3) -> List[Vector]:
-        return [Vector(1 if i == j else 0 for i in range(n)) for j in range(n)]
+        return [Vector._wrap(list(row)) for row in _eye_rows(n)]
 
     def point(self) -> Point:
-        from .point import Point
-        return Point(self._value)
\ No newline at end of file
+        return Point(self._value)
+
+
+# -------------------------------------------------------------------------
+# 7  Referencias diferidas --------------------------------------------------
+# -------------------------------------------------------------------------
+def _bind_late_refs() -> None:
+    """
+    Enlaza Point, Matrix y _eye_rows como globales del módulo. Los módulos
+    de Point y Matrix importan este, así que no pueden importarse arriba;
+    structures/__init__ llama a esta función cuando ya están cargados y los
+    métodos dejan de pagar un `import` local en cada llamada.
+    """
+    global Point, Matrix, _eye_rows
+    from .point import Point
+    from .matrix.matrix import Matrix, _eye_rows
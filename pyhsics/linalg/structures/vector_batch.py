@@ -0,0 +1,111 @@
+# vector_batch.py  ---------------------------------------------------------
+# Lote de vectores de igual dimensión guardado como un único ndarray (k, n).
+# -------------------------------------------------------------------------
+#  • Layout SoA: las operaciones en bloque (restas contra un origen,
+#    escalados…) se hacen con una sola llamada de NumPy en vez de k
+#    despachos Python sobre objetos Vector.
+#  • Al iterar se materializan objetos Vector corrientes.
+#  • dot / cross en bloque: quien tenga muchos Vector debería agruparlos
+#    una vez en un VectorBatch y operar sobre él.
+# -------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Optional, Tuple, Union, TYPE_CHECKING
+
+import numpy as np
+
+from ..core.algebraic_core import ScalarLike, SCALAR_TYPES
+from .vector import Vector, VectorCore
+
+if TYPE_CHECKING:
+    from .matrix.matrix import Matrix
+
+
+class VectorBatch:
+    """Conjunto ordenado de k vectores de dimensión n respaldado por un ndarray (k, n)."""
+
+    __slots__ = ("_arr",)
+
+    def __init__(self, rows: Union[np.ndarray, Iterable[Iterable[ScalarLike]]]) -> None:
+        arr = rows if isinstance(rows, np.ndarray) else np.array([list(r) for r in rows])
+        if arr.ndim != 2:
+            raise ValueError("Un VectorBatch necesita un array bidimensional (k, n).")
+        self._arr = arr
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[VectorCore]) -> VectorBatch:
+        return cls(v.value for v in vectors)
+
+    # ---------------- propiedades / iterable ------------------------------
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """-> (k, n)    Vectores, Dimensión"""
+        k, n = self._arr.shape
+        return k, n
+
+    def __len__(self) -> int:
+        return self._arr.shape[0]
+
+    def __iter__(self) -> Iterator[Vector]:
+        return (Vector(row.tolist()) for row in self._arr)
+
+    def __getitem__(self, idx: int) -> Vector:
+        return Vector(self._arr[idx].tolist())
+
+    # ---------------- aritmética en bloque --------------------------------
+    def __add__(self, other: Union[VectorBatch, VectorCore]) -> VectorBatch:
+        return VectorBatch(self._arr + self._operand(other))
+
+    def __sub__(self, other: Union[VectorBatch, VectorCore]) -> VectorBatch:
+        return VectorBatch(self._arr - self._operand(other))
+
+    def __neg__(self) -> VectorBatch:
+        return VectorBatch(-self._arr)
+
+    def __mul__(self, other: ScalarLike) -> VectorBatch:
+        if not isinstance(other, SCALAR_TYPES):
+            return NotImplemented
+        return VectorBatch(self._arr * other)
+
+    __rmul__ = __mul__
+
+    # ---------------- productos en bloque ---------------------------------
+    def dot(self, other: Union[VectorBatch, VectorCore], *, form: Optional[Matrix] = None) -> np.ndarray:
+        """
+        Producto punto fila a fila (k,), con la misma forma bilineal que
+        Vector.dot: `form`, o la fijada con Vector.set_dot_form.
+        """
+        arr = np.broadcast_to(self._operand(other), self._arr.shape)
+        if form is None:
+            form = Vector._dot_product_matrix
+        if form is None:
+            return np.einsum('ij,ij->i', self._arr, arr)
+        M = np.array(form.value)
+        if M.shape != (self._arr.shape[1],) * 2:
+            raise ValueError("Dimensiones incompatibles en producto bilineal")
+        #   wᵀ · M · v  por fila
+        return np.einsum('ij,jk,ik->i', arr, M, self._arr)
+
+    def cross(self, other: Union[VectorBatch, VectorCore]) -> VectorBatch:
+        """Producto cruz fila a fila; sólo para vectores de R³."""
+        if self._arr.shape[1] != 3:
+            raise ValueError("El producto cruz sólo está definido en R³")
+        b = np.broadcast_to(self._operand(other), self._arr.shape)
+        a1, a2, a3 = self._arr[:, 0], self._arr[:, 1], self._arr[:, 2]
+        b1, b2, b3 = b[:, 0], b[:, 1], b[:, 2]
+        return VectorBatch(np.stack([a2 * b3 - a3 * b2,
+                                     a3 * b1 - a1 * b3,
+                                     a1 * b2 - a2 * b1], axis=-1))
+
+    def _operand(self, other: Union[VectorBatch, VectorCore]) -> np.ndarray:
+        """Array a operar; un VectorCore se difunde sobre todas las filas."""
+        if isinstance(other, VectorBatch):
+            arr = other._arr
+        elif isinstance(other, VectorCore):
+            arr = np.array(other.value)
+        else:
+            raise TypeError(f"Operando no soportado: {other.__class__.__name__}")
+        if arr.shape[-1] != self._arr.shape[1]:
+            raise ValueError("Dimensiones incompatibles")
+        return arr
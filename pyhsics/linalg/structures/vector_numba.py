@@ -0,0 +1,97 @@
+# vector_numba.py  -------------------------------------------------------
+# Núcleos numéricos de Vector compilados con Numba.
+# -------------------------------------------------------------------------
+#  • Numba es opcional: si no está instalado, los núcleos valen None y
+#    Vector usa NumPy sobre sus copias `_array`.
+#  • Trabajan sobre ndarrays float64 contiguos (las cachés `_array`).
+#  • No hay núcleo para `cross`: en R³ el desempaquetado Python de la
+#    lista es más rápido que cruzar la frontera hacia código compilado.
+#  • El producto punto de vectores muy largos se reparte entre hilos
+#    (`prange`); PYHSICS_THREADS fija cuántos (0 ó 1 lo desactiva). El
+#    límite se aplica sólo alrededor de cada llamada, sin tocar el número
+#    global de hilos de Numba; un valor no entero se ignora.
+# -------------------------------------------------------------------------
+
+import os
+from typing import Callable, Optional
+
+import numpy as np
+
+try:
+    import numba  # type: ignore
+    from numba import njit, prange  # type: ignore
+except ImportError:
+    numba = njit = None
+    prange = range
+
+# Por debajo de esta dimensión repartir la reducción no compensa el
+# arranque de los hilos: BLAS (ddot) en un solo hilo es más rápido
+_PARALLEL_MIN_LEN = 4096
+
+
+def _bilinear_kernel(v: np.ndarray, M: np.ndarray, w: np.ndarray) -> float:
+    """wᵀ · (M · v) sin crear el vector intermedio M · v."""
+    n, m = M.shape
+    acc = 0.0
+    for i in range(n):
+        row = 0.0
+        for j in range(m):
+            row += M[i, j] * v[j]
+        acc += w[i] * row
+    return acc
+
+
+_bilinear_f64: Optional[Callable[[np.ndarray, np.ndarray, np.ndarray], float]] = (
+    njit(cache=True, fastmath=True)(_bilinear_kernel) if njit is not None else None
+)
+
+
+def _dot_kernel(a: np.ndarray, b: np.ndarray) -> float:
+    """a · b con la suma repartida entre hilos (reducción de `prange`)."""
+    acc = 0.0
+    for i in prange(a.shape[0]):
+        acc += a[i] * b[i]
+    return acc
+
+
+def _parallel_threads() -> Optional[int]:
+    """
+    Hilos pedidos en PYHSICS_THREADS (acotados por NUMBA_NUM_THREADS), o
+    None si la variable no está definida o no es un entero: entonces se
+    respeta el número de hilos que tenga Numba.
+    """
+    try:
+        threads = int(os.environ["PYHSICS_THREADS"])
+    except (KeyError, ValueError):
+        return None
+    return max(0, min(threads, numba.config.NUMBA_NUM_THREADS))
+
+
+def _limited(kernel: Callable[[np.ndarray, np.ndarray], float],
+             threads: int) -> Callable[[np.ndarray, np.ndarray], float]:
+    """
+    Envuelve `kernel` para que use `threads` hilos sólo durante la llamada.
+    set_num_threads es local al hilo que llama y se restaura al salir: el
+    resto del proceso conserva su configuración de Numba.
+    """
+    def call(a: np.ndarray, b: np.ndarray) -> float:
+        previous = numba.get_num_threads()
+        numba.set_num_threads(threads)
+        try:
+            return kernel(a, b)
+        finally:
+            numba.set_num_threads(previous)
+    return call
+
+
+def _make_dot_parallel() -> Optional[Callable[[np.ndarray, np.ndarray], float]]:
+    if numba is None:
+        return None
+    threads = _parallel_threads()
+    if (numba.config.NUMBA_NUM_THREADS if threads is None else threads) <= 1:
+        return None
+    kernel = njit(parallel=True, fastmath=True, cache=True)(_dot_kernel)
+    # Sin PYHSICS_THREADS el núcleo usa los hilos que tenga Numba
+    return kernel if threads is None else _limited(kernel, threads)
+
+_dot_parallel_f64: Optional[Callable[[np.ndarray, np.ndarray], float]] = _make_dot_parallel()
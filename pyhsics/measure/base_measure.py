@@ -4,6 +4,7 @@ from math import floor, log10
 from typing import TYPE_CHECKING, Optional, Tuple, Union
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cached_property
 from IPython.display import display, Latex #type: ignore
 
 from ..printing.printable import Printable
@@ -85,10 +86,17 @@ class MeasureBaseClass(Printable, ABC):
         from .operator_measure import MeasureAlgebraicOperator
         return MeasureAlgebraicOperator.pow(self, other)
         
-    def normalice_str(self) -> Tuple[Union[int,  float], Union[int,  float], int]:
-        """value, error, exp"""
+    # Las medidas no cambian tras construirse: el redondeo y la notación
+    # científica se calculan una vez y los reutilizan __str__ y _repr_latex_
+    @cached_property
+    def _rounded(self) -> Tuple[Union[int, float], Union[int, float]]:
+        """value, error redondeados según la cifra significativa del error"""
         from .utils_measure import round_measure
-        value_rnd, error_rnd = round_measure(self.value, self.error)
+        return round_measure(self.value, self.error)
+
+    @cached_property
+    def _normalized(self) -> Tuple[Union[int, float], Union[int, float], int]:
+        value_rnd, error_rnd = self._rounded
         # Extraemos el exponente a partir del valor redondeado
         exponent = floor(log10(abs(error_rnd)))
         factor: int = 10 ** exponent
@@ -98,3 +106,7 @@ class MeasureBaseClass(Printable, ABC):
         value_norm = int(value_norm) if value_norm.is_integer() else value_norm
         error_norm = int(error_norm) if error_norm.is_integer() else error_norm
         return (value_norm, error_norm, exponent)
+
+    def normalice_str(self) -> Tuple[Union[int,  float], Union[int,  float], int]:
+        """value, error, exp"""
+        return self._normalized
@@ -1,12 +1,32 @@
+from functools import lru_cache
 from math import floor, log10
-from typing import Dict, List, Optional, Tuple
-from sympy import Symbol, sympify, Expr, diff, sqrt # type: ignore
+from typing import Callable, Dict, Optional, Tuple
+from sympy import Symbol, sympify, Expr, diff, lambdify, sqrt # type: ignore
 
 from ..quantity import ScalarQuantity
 from ..units import Unit
 
 from .base_measure import MeasureBaseClass
 from .direct_measure import DirectMeasure
+from .unit_calculator import UnitCalculator
+
+@lru_cache(maxsize=128)
+def _compile_formula(formula_expr: str, keys: Tuple[str, ...]) -> Tuple[Expr, Expr, Callable[..., float], Callable[..., float]]:
+    """
+    Simplifica la fórmula y la compila (lambdify) junto con su fórmula de
+    error una sola vez por (fórmula, variables). Al calcular muchas medidas
+    con la misma fórmula (tablas de datos) se evita repetir simplify, diff
+    y subs en cada una.
+    Devuelve (fórmula, fórmula de error, f(valores...), Δf(valores..., errores...)).
+    """
+    sym_dict = {key: Symbol(key) for key in keys}
+    formula: Expr = sympify(formula_expr, locals=sym_dict).simplify() # type: ignore
+    symbols = list(sym_dict.values())
+    deltas = [Symbol(f"Δ{var}") for var in symbols]
+    error: Expr = sqrt(sum((diff(formula, var) * d_sym) ** 2 for var, d_sym in zip(symbols, deltas))) # type: ignore
+    modules = ["math", "sympy"]
+    return formula, error, lambdify(symbols, formula, modules), lambdify(symbols + deltas, error, modules)
+
 
 class CalculatedMeasure(MeasureBaseClass):
     """
@@ -38,42 +58,38 @@ class CalculatedMeasure(MeasureBaseClass):
         self.formula_str:   str                         = formula_str
         self.measurements:  Dict[str, DirectMeasure]    = measurements
         self._sym_dict:     dict[str, Symbol]           = {key: Symbol(key) for key in measurements.keys()}
-        self.formula:       Expr                        = sympify(formula_expr, locals=self._sym_dict).simplify() # type: ignore
+        self.formula, self._error_formula, self._value_fn, self._error_fn = _compile_formula(formula_expr, tuple(self._sym_dict))
         
         units = self.calc_units()
         self._value = ScalarQuantity(self.calc_numeric_value(), units)
         self._error = ScalarQuantity(self.calc_numeric_error(), units)
         self._units = units
+        self._direct: Optional[DirectMeasure] = None
 
     def error_formula(self) -> Expr:
-        errors: List[Tuple[Expr, Symbol]] = []
-        for var in self._sym_dict.values():
-            delta_sym = Symbol(f"Δ{var}")
-            dfdx = diff(self.formula, var)
-            errors.append((dfdx, delta_sym))
-        return sqrt(sum((d * d_sym) ** 2 for d, d_sym in errors)) # type: ignore
+        # Las derivadas ya se calcularon (una vez por fórmula) al compilarla
+        return self._error_formula
 
     def calc_numeric_error(self) -> float:
-        subs = {}
-        for key, dm in self.measurements.items():
-            subs[self._sym_dict[key]] = dm.value.value
-            subs[Symbol(f"Δ{self._sym_dict[key]}")] = dm.error.value
-        return float(self.error_formula().subs(subs)) # type: ignore
+        values = [float(dm.value.value) for dm in self.measurements.values()]
+        errors = [float(dm.error.value) for dm in self.measurements.values()]
+        return float(self._error_fn(*values, *errors))
 
     def calc_numeric_value(self) -> float:
-        subs = {self._sym_dict[key]: dm.value.value for key, dm in self.measurements.items()}
-        return float(self.formula.subs(subs)) # type: ignore
+        return float(self._value_fn(*(float(dm.value.value) for dm in self.measurements.values())))
 
     def calc_units(self) -> Unit:
-        from .unit_calculator import UnitCalculator
         calculator = UnitCalculator(self.formula, self.measurements)
         return Unit.from_unit_composition(calculator.compute_total_units())
 
     def as_direct_measure(self) -> 'DirectMeasure':
-        from .direct_measure import DirectMeasure
-        return DirectMeasure(self.value, 
-                             self.error, 
-                             self.units)
+        # Se construye una vez: los operadores (también los reflejados) y la
+        # impresión la piden en cada llamada
+        if self._direct is None:
+            self._direct = DirectMeasure(self.value, 
+                                         self.error, 
+                                         self.units)
+        return self._direct
 
     def __str__(self) -> str:
         dm = self.as_direct_measure()
@@ -87,8 +103,7 @@ class CalculatedMeasure(MeasureBaseClass):
             formula_latex = self.name + '\\;=\\;' + formula_latex
         dm = self.as_direct_measure()
         
-        from .utils_measure import round_measure
-        value_rnd, error_rnd = round_measure(dm.value, dm.error)
+        value_rnd, error_rnd = dm._rounded
         if 0.001 < abs(value_rnd) < 10_000:
             return f"${formula_latex} = ({value_rnd} \\pm {error_rnd})" + "\\;\\;" + self.units.latex() + "$"
         else:
@@ -97,13 +112,14 @@ class CalculatedMeasure(MeasureBaseClass):
         
 
     def __neg__(self) -> 'DirectMeasure':
-        from .direct_measure import DirectMeasure
         return DirectMeasure(-self.value.value, self.error.value, self.units)
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, MeasureBaseClass):
+        if type(other) is not type(self) and not isinstance(other, MeasureBaseClass):
+            return False
+        # Con unidades distintas no hace falta operar valores ni errores
+        if self.units != other.units:
             return False
-        same_units = self.units == other.units
         value_difference = abs(self.value - other.value)
         tolerance = self.error + other.error
-        return same_units and value_difference < tolerance
+        return value_difference < tolerance
@@ -1,4 +1,6 @@
-from typing import Optional, Union
+from typing import List, Optional, Union
+
+import numpy as np
 
 from ..linalg import Scalar, ScalarLike
 
@@ -10,8 +12,9 @@ class DirectMeasure(MeasureBaseClass):
     """
     Medida directa que representa un valor, su incertidumbre y sus unidades.
     """
-    _real_value: Scalar
-    _real_error: Scalar
+    # Valor y error sin redondear ni escalar por el prefijo, como float
+    _real_value: float
+    _real_error: float
     
     _value: ScalarQuantity
     _error: ScalarQuantity
@@ -43,16 +46,52 @@ class DirectMeasure(MeasureBaseClass):
         new_val, new_err, new_units = process_measure_error_unit(value, error, units)        
         value_rnd, error_rnd = round_measure(new_val, new_err)
         
-        self._real_value = Scalar(value)
-        self._real_error = Scalar(error)
+        self._real_value = value
+        self._real_error = error
         
         self._value = ScalarQuantity(value_rnd, new_units)
         self._error = ScalarQuantity(error_rnd, new_units)
         self._units = new_units
+        # Ya están redondeados: se fija aquí la caché `_rounded` de la base
+        # para que imprimir no vuelva a pasar por round_measure (que además
+        # no es idempotente: 100000 → 99999.99999999999)
+        self._rounded = (value_rnd, error_rnd)
+
+    @classmethod
+    def from_arrays(cls,
+                    values: np.ndarray,
+                    errors: np.ndarray,
+                    units: Union[str, Unit] = "1") -> List["DirectMeasure"]:
+        """
+        Crea una DirectMeasure por cada par (valor, error), todas con las
+        mismas unidades. Equivale a llamar al constructor en bucle, pero las
+        unidades se procesan una vez y el redondeo se hace sobre los arrays.
+        """
+        from .utils_measure import round_measures, get_prefix_and_composition
+        values = np.asarray(values)
+        errors = np.asarray(errors)
+        if np.iscomplexobj(values) or np.iscomplexobj(errors):
+            raise ValueError("Complex numbers are not supported.")
+        values, errors = np.broadcast_arrays(values.astype(float), errors.astype(float))
+
+        prefix, composition = get_prefix_and_composition(units)
+        new_units = Unit.from_unit_composition(composition)
+        rounded = round_measures(prefix * values.ravel(), prefix * errors.ravel())
+
+        measures: List[DirectMeasure] = []
+        for value, error, (value_rnd, error_rnd) in zip(values.ravel().tolist(), errors.ravel().tolist(), rounded):
+            measure = cls.__new__(cls)
+            measure._real_value = value
+            measure._real_error = error
+            measure._value = ScalarQuantity(value_rnd, new_units)
+            measure._error = ScalarQuantity(error_rnd, new_units)
+            measure._units = new_units
+            measure._rounded = (value_rnd, error_rnd)
+            measures.append(measure)
+        return measures
         
     def __str__(self) -> str:
-        from .utils_measure import round_measure
-        value_rnd, error_rnd = round_measure(self.value, self.error)
+        value_rnd, error_rnd = self._rounded
         if 0.001 < abs(value_rnd) < 10000:
             return f"({value_rnd} ± {error_rnd}) {self.units}"
         else:
@@ -62,8 +101,7 @@ class DirectMeasure(MeasureBaseClass):
             return f"({value_norm} ± {error_norm})·10{exp_str} {self.units}"
 
     def _repr_latex_(self, name: Optional[str] = None) -> str:
-        from .utils_measure import round_measure
-        value_rnd, error_rnd = round_measure(self.value, self.error)
+        value_rnd, error_rnd = self._rounded
         if 0.001 < abs(value_rnd) < 10_000:
             return f"$({value_rnd} \\pm {error_rnd})" + "\\;\\;" + self.units.latex() + "$"
         else:
@@ -74,10 +112,12 @@ class DirectMeasure(MeasureBaseClass):
         return DirectMeasure(-self.value.value, self.error.value, self.units)
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, MeasureBaseClass):
+        if type(other) is not type(self) and not isinstance(other, MeasureBaseClass):
+            return False
+        # Con unidades distintas no hace falta operar valores ni errores
+        if self.units != other.units:
             return False
-        same_units = self.units == other.units
         value_difference = abs(self.value - other.value).value
         tolerance = (self.error + other.error).value
-        return same_units and value_difference <= tolerance
+        return value_difference <= tolerance
         
\ No newline at end of file
@@ -0,0 +1,37 @@
+# measure_numba.py  ------------------------------------------------------
+# Núcleo del redondeo de medidas compilado con Numba.
+# -------------------------------------------------------------------------
+#  • Numba es opcional: si no está instalado, `_round_error_f64` vale None
+#    y round_measure sigue en Python puro.
+#  • Sólo el redondeo del error (log10, floor, pow) se compila: el round()
+#    con decimales de Numba no es el de Python (redondeo decimal correcto)
+#    y cambiaría los valores impresos, así que el valor se redondea fuera.
+#  • Sin fastmath: el resultado debe coincidir bit a bit con Python.
+# -------------------------------------------------------------------------
+
+import math
+from typing import Callable, Optional, Tuple
+
+try:
+    from numba import njit  # type: ignore
+except ImportError:
+    njit = None
+
+# Por debajo de este error el factor 10**k deja de ser exacto en float y
+# Python divide por el entero: esos casos no pasan por el núcleo.
+JIT_MIN_ERROR = 1e-22
+
+
+def _round_error_kernel(error: float) -> Tuple[float, int]:
+    """Error a una cifra significativa y el exponente de su década."""
+    exponent = math.floor(math.log10(abs(error)))
+    # Exponente float: con uno entero Numba multiplica (powi) y el último
+    # bit no coincide con el pow() de Python
+    factor = math.pow(10.0, float(-exponent))
+    rounded = round(error * factor) / factor
+    return rounded, math.floor(math.log10(abs(rounded)))
+
+
+_round_error_f64: Optional[Callable[[float], Tuple[float, int]]] = (
+    njit(cache=True)(_round_error_kernel) if njit is not None else None
+)
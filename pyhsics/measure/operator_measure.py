@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from math import sqrt
+from math import hypot
 
 from ..units import Unit
 from .direct_measure import DirectMeasure
@@ -23,7 +23,7 @@ class MeasureAlgebraicOperator:
         e1 = float(M1.error)
         
         v2 = float(M2.value)
-        e2 = float(M2.value)
+        e2 = float(M2.error)
         
         return (v1, e1, unit1), (v2, e2, unit2)
         
@@ -33,7 +33,7 @@ class MeasureAlgebraicOperator:
         if unit1 != unit2:
             raise ValueError(f"Las unidades no son compatibles: {unit1} vs {unit2}")
         new_value = v1 + v2
-        new_error = sqrt(e1**2 + e2**2)
+        new_error = hypot(e1, e2)
         return DirectMeasure(new_value, new_error, unit1)       
     
     @classmethod
@@ -42,7 +42,7 @@ class MeasureAlgebraicOperator:
         new_value  = abs(v1 * v2)
         rel_error1 = e1 / abs(v1) if v1 else 0
         rel_error2 = e2 / abs(v2) if v2 else 0
-        new_error = new_value * sqrt(rel_error1 ** 2 + rel_error2 ** 2)
+        new_error = new_value * hypot(rel_error1, rel_error2)
         return DirectMeasure(new_value, new_error, unit1*unit2)
     
     @classmethod
@@ -53,7 +53,7 @@ class MeasureAlgebraicOperator:
         new_value = abs(v1 / v2)
         rel_error1 = e1 / abs(v1) if v1 else 0
         rel_error2 = e2 / abs(v2) if v2 else 0
-        new_error = new_value * sqrt(rel_error1**2 + rel_error2**2)
+        new_error = new_value * hypot(rel_error1, rel_error2)
         new_units = unit1 / unit2
         return DirectMeasure(new_value, new_error, new_units)
     
@@ -1,7 +1,9 @@
 from __future__ import annotations
 from sympy import Expr, Symbol 
-from typing import Dict, TYPE_CHECKING
+from typing import Callable, ClassVar, Dict, TYPE_CHECKING
 
+from ..units.basic_typing import RealLike
+from ..units.fundamental_unit import FundamentalUnit
 from ..units.unit_composition import UnitComposition
 
 if TYPE_CHECKING:
@@ -9,101 +11,153 @@ if TYPE_CHECKING:
 
 dimensionless = UnitComposition({})
 
+# Funciones matemáticas que requieren argumentos adimensionales
+# (puedes ampliar esta lista según tus necesidades)
+_DIMENSIONLESS_FUNCS = frozenset({
+    "sin", "cos", "tan", "asin", "acos", "atan",
+    "sinh", "cosh", "tanh", "asinh", "acosh", "atanh",
+    "exp", "log", "ln"
+})
+
 class UnitCalculator:
     """
     Esta clase se encarga de calcular la composición de unidades a partir
     de una expresión simbólica y un diccionario de medidas.
     """
 
+    # type(expr) -> manejador de _parse; se rellena en el primer uso de
+    # cada tipo de nodo de SymPy
+    _dispatch: ClassVar[Dict[type, Callable[[UnitCalculator, Expr], UnitComposition]]] = {}
+
     def __init__(self, formula: Expr, measurements: Dict[str, DirectMeasure]):
         self.formula = formula
         self.measurements = measurements
+        # Subexpresión -> unidades. Las expresiones de SymPy son hashables y
+        # los subárboles iguales comparan iguales: cada uno se analiza una vez
+        self._cache: Dict[Expr, UnitComposition] = {}
+        # Nombre del símbolo -> composición de sus unidades, resuelta una vez
+        self._sym_units: Dict[str, UnitComposition] = {
+            name: measure.units.composition for name, measure in measurements.items()
+        }
 
     def get_unit(self, symbol: Symbol) -> UnitComposition:
         """
         Retorna la composición de unidad para un símbolo dado.
         Si el símbolo no se encuentra en measurements, se lanza un error.
         """
-        sym_str = str(symbol)
-        if sym_str in self.measurements:
-            unit = self.measurements[sym_str].units.composition
-            return unit
-        else:
-            raise ValueError(f"Medida para {sym_str} no encontrada en measurements.")
+        try:
+            return self._sym_units[symbol.name]
+        except KeyError:
+            raise ValueError(f"Medida para {symbol.name} no encontrada en measurements.") from None
 
     def parse_expression(self, expr: Expr) -> UnitComposition:
         """
         Función recursiva que devuelve la composición de unidades correspondiente a la expresión.
         Maneja casos de suma, multiplicación y potencia.
         """
-        if expr.is_Number:
-            # Los números se consideran adimensionales
-            return UnitComposition({})
-
-        if expr.is_Symbol:
-            return self.get_unit(expr)  # type: ignore
-
-        if expr.is_Add:
-            # En una suma, se espera que todos los términos tengan la misma unidad.
-            term_units = [self.parse_expression(arg) for arg in expr.args]  # type: ignore
-            base_unit = term_units[0]
-            for u in term_units[1:]:
-                if u != base_unit:
-                    raise ValueError("Incompatibilidad de unidades en la suma.")
-            return base_unit
-
-        if expr.is_Mul:
-            # Para una multiplicación, se combinan las unidades multiplicativamente.
-            result = UnitComposition({})
-            for factor in expr.args:
-                factor_unit = self.parse_expression(factor)  # type: ignore
-                result *= factor_unit
-            return result
-
-        if expr.is_Pow:
-            # Para una potencia, se evalúa la base y se eleva la unidad al exponente.
-            base, exponent = expr.as_base_exp()
-            base_unit = self.parse_expression(base)
-            if exponent.is_number:
-                exp_val = float(exponent)
-                return base_unit ** exp_val
-            else:
-                # Se permite el uso de exponentes simbólicos
-                return base_unit ** exponent
-        
-        if expr.is_Function:
-                # Identificamos la función por su nombre
-                func_name = expr.func.__name__
-
-                # Funciones matemáticas que requieren argumentos adimensionales
-                # (puedes ampliar esta lista según tus necesidades)
-                dimensionless_funcs = {
-                    "sin", "cos", "tan", "asin", "acos", "atan",
-                    "sinh", "cosh", "tanh", "asinh", "acosh", "atanh",
-                    "exp", "log", "ln"
-                }
-
-                if func_name in dimensionless_funcs:
-                    # Verificamos que todos los argumentos sean adimensionales
-                    for arg in expr.args:
-                        arg_unit = self.parse_expression(arg)
-                        if arg_unit != dimensionless:
-                            raise ValueError(
-                                f"Los argumentos de la función '{func_name}' deben ser adimensionales. "
-                                f"Se encontró {arg_unit} en su lugar."
-                            )
-                    # El resultado de estas funciones suele ser adimensional
-                    return dimensionless
-
-                # Si se requieren más validaciones o comportamientos diferentes,
-                # se pueden agregar elif adicionales aquí.
-                # Por ejemplo, si quisieras tratar específicamente el ángulo en radianes,
-                # podrías manejarlo aparte.
-
-                raise NotImplementedError(
-                    f"La función '{func_name}' no está soportada para análisis de unidades."
-                )
-
+        result = self._cache.get(expr)
+        if result is None:
+            result = self._cache[expr] = self._parse(expr)
+        return result
+
+    def _parse(self, expr: Expr) -> UnitComposition:
+        # Un acceso al dict por nodo en lugar de la cadena is_Number /
+        # is_Symbol / is_Add / ... (los flags de SymPy son de clase, así que
+        # el manejador se decide una vez por tipo)
+        handler = self._dispatch.get(type(expr))
+        if handler is None:
+            handler = self._dispatch[type(expr)] = self._handler_for(type(expr))
+        return handler(self, expr)
+
+    @staticmethod
+    def _handler_for(cls: type) -> Callable[[UnitCalculator, Expr], UnitComposition]:
+        if cls.is_Number:  # type: ignore[attr-defined]
+            return UnitCalculator._parse_number
+        if cls.is_Symbol:  # type: ignore[attr-defined]
+            return UnitCalculator._parse_symbol
+        if cls.is_Add:  # type: ignore[attr-defined]
+            return UnitCalculator._parse_add
+        if cls.is_Mul:  # type: ignore[attr-defined]
+            return UnitCalculator._parse_mul
+        if cls.is_Pow:  # type: ignore[attr-defined]
+            return UnitCalculator._parse_pow
+        if cls.is_Function:  # type: ignore[attr-defined]
+            return UnitCalculator._parse_function
+        return UnitCalculator._parse_unsupported
+
+    def _parse_number(self, expr: Expr) -> UnitComposition:
+        # Los números se consideran adimensionales
+        return UnitComposition({})
+
+    def _parse_symbol(self, expr: Expr) -> UnitComposition:
+        return self.get_unit(expr)  # type: ignore
+
+    def _parse_add(self, expr: Expr) -> UnitComposition:
+        # En una suma, se espera que todos los términos tengan la misma unidad.
+        # Cada término se compara según se analiza (una sola pasada, sin
+        # lista intermedia); los unit_dict ya vienen sin exponentes nulos.
+        # Los términos numéricos son adimensionales: se comparan sin recursión.
+        args = expr.args
+        first = args[0]
+        base_unit = dimensionless if first.is_number else self.parse_expression(first)  # type: ignore
+        base_dict = base_unit.unit_dict
+        for arg in args[1:]:
+            unit_dict = dimensionless.unit_dict if arg.is_number else self.parse_expression(arg).unit_dict  # type: ignore
+            if unit_dict != base_dict:
+                raise ValueError("Incompatibilidad de unidades en la suma.")
+        return base_unit
+
+    def _parse_mul(self, expr: Expr) -> UnitComposition:
+        # Para una multiplicación, se combinan las unidades multiplicativamente.
+        # Los exponentes se acumulan en un único dict y la composición se
+        # construye (y limpia) una sola vez, sin intermedios por factor.
+        # Los factores numéricos (también pi, sqrt(2), ...) no aportan unidades.
+        acc: Dict[FundamentalUnit, RealLike] = {}
+        get = acc.get
+        for factor in expr.args:
+            if factor.is_number:  # type: ignore
+                continue
+            for unit, power in self.parse_expression(factor).unit_dict.items():  # type: ignore
+                acc[unit] = get(unit, 0) + power
+        return UnitComposition(acc)
+
+    def _parse_pow(self, expr: Expr) -> UnitComposition:
+        # Para una potencia, se evalúa la base y se eleva la unidad al exponente.
+        base, exponent = expr.as_base_exp()
+        base_unit = self.parse_expression(base)
+        if exponent.is_number:
+            exp_val = float(exponent)
+            return base_unit ** exp_val
+        else:
+            # Se permite el uso de exponentes simbólicos
+            return base_unit ** exponent
+
+    def _parse_function(self, expr: Expr) -> UnitComposition:
+        # Identificamos la función por su nombre
+        func_name = expr.func.__name__
+
+        if func_name in _DIMENSIONLESS_FUNCS:
+            # Verificamos que todos los argumentos sean adimensionales
+            for arg in expr.args:
+                arg_unit = self.parse_expression(arg)  # type: ignore
+                if arg_unit != dimensionless:
+                    raise ValueError(
+                        f"Los argumentos de la función '{func_name}' deben ser adimensionales. "
+                        f"Se encontró {arg_unit} en su lugar."
+                    )
+            # El resultado de estas funciones suele ser adimensional
+            return dimensionless
+
+        # Si se requieren más validaciones o comportamientos diferentes,
+        # se pueden agregar casos adicionales aquí.
+        # Por ejemplo, si quisieras tratar específicamente el ángulo en radianes,
+        # podrías manejarlo aparte.
+
+        raise NotImplementedError(
+            f"La función '{func_name}' no está soportada para análisis de unidades."
+        )
+
+    def _parse_unsupported(self, expr: Expr) -> UnitComposition:
         # Si el tipo de expresión no se reconoce, se lanza un error.
         raise TypeError(f"Tipo de expresión no soportada: {expr}")
 
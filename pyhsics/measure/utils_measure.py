@@ -1,9 +1,12 @@
 from __future__ import annotations
 import math
-from typing import Tuple, Union, TYPE_CHECKING, SupportsFloat
+from typing import Any, Callable, Dict, List, Tuple, Union, TYPE_CHECKING, SupportsFloat
+
+import numpy as np
 
 from ..linalg import ScalarLike, Scalar
 from ..units import Unit
+from .measure_numba import _round_error_f64, JIT_MIN_ERROR
 
 if TYPE_CHECKING:
     from .base_measure import MeasureBaseClass
@@ -11,12 +14,23 @@ if TYPE_CHECKING:
     
 Operable = Union[ScalarLike, Scalar, 'MeasureBaseClass']
 
+# 10**k tal como lo calcula Python (pow() de la libm para k < 0), indexado
+# por k - _POW10_MIN. Un acceso a la tupla es más barato que `**`, y
+# np.power no da siempre el mismo último bit. Se corta en 1e22, la mayor
+# potencia exacta en float: a partir de ahí Python divide por el entero.
+_POW10_MIN, _POW10_MAX = -330, 22
+_POW10 = tuple(float(10 ** k) for k in range(_POW10_MIN, _POW10_MAX + 1))
+_POW10_ARRAY = np.array(_POW10)
+
 def round_significant_error(error: SupportsFloat, sig: int = 1) -> float:
     error = float(error)
     if error == 0:
         return 0
     exponent = math.floor(math.log10(abs(error)))
-    factor = 10 ** (-exponent + sig - 1)
+    try:
+        factor = _POW10[sig - 1 - exponent - _POW10_MIN]
+    except IndexError:  # errores < 1e-22
+        factor = 10 ** (-exponent + sig - 1)
     return round(error * factor) / factor
 
 def round_by_error(value: float, error: float) -> float:
@@ -28,7 +42,10 @@ def round_by_error(value: float, error: float) -> float:
     if error == 0:
         return value
 
-    exponent = math.floor(math.log10(error))
+    return _round_to_exponent(value, math.floor(math.log10(error)))
+
+def _round_to_exponent(value: float, exponent: int) -> float:
+    """Redondea 'value' a la década 10^exponent del error."""
     if exponent >= 0:
         factor = 10 ** exponent
         return round(value / factor) * factor
@@ -38,27 +55,86 @@ def round_by_error(value: float, error: float) -> float:
 
 def round_measure(value: SupportsFloat, error: SupportsFloat) -> Tuple[float, float]:
     value, error = float(value), float(error)
-    error_rounded = round_significant_error(error, 1)
-    value_rounded = round_by_error(value, error_rounded)
+    if _round_error_f64 is not None and JIT_MIN_ERROR <= abs(error) < math.inf:
+        error_rounded, exponent = _round_error_f64(error)
+        value_rounded = _round_to_exponent(value, exponent)
+    else:
+        error_rounded = round_significant_error(error, 1)
+        value_rounded = round_by_error(value, error_rounded)
     value_rounded = int(value_rounded) if value_rounded.is_integer() else value_rounded
     error_rounded = int(error_rounded) if error_rounded.is_integer() else error_rounded
     return value_rounded, error_rounded
 
+def round_measures(values: np.ndarray, errors: np.ndarray) -> List[Tuple[float, float]]:
+    """
+    round_measure para arrays de medidas. Los exponentes (floor(log10)) y el
+    redondeo del error a una cifra significativa se hacen con NumPy de una
+    vez; el valor se redondea con round() de Python para dar exactamente lo
+    mismo que round_measure.
+    """
+    values = np.asarray(values, dtype=float)
+    errors = np.asarray(errors, dtype=float)
+    # Errores inf/nan: se apartan de la tabla de potencias (su exponente no
+    # es un entero) y se delegan en round_measure, que lanza lo mismo que
+    # el camino escalar (OverflowError / ValueError)
+    finite = np.isfinite(errors)
+    nonzero = (errors != 0) & finite
+    exps = np.floor(np.log10(np.where(nonzero, np.abs(errors), 1.0))).astype(int)
+    factors = _POW10_ARRAY[np.minimum(-exps, _POW10_MAX) - _POW10_MIN]
+    errors_rnd = np.where(nonzero, np.rint(errors * factors) / factors, 0.0)
+    # Errores < 1e-22: el factor no es exacto en float, se rehacen uno a uno
+    for i in np.flatnonzero(nonzero & (exps < -_POW10_MAX)).tolist():
+        errors_rnd[i] = round_significant_error(errors[i])
+    # El redondeo puede subir de década (0.96 → 1): exponente del ya redondeado
+    exps_rnd = np.floor(np.log10(np.where(nonzero, np.abs(errors_rnd), 1.0))).astype(int)
+
+    result: List[Tuple[float, float]] = []
+    for value, error, exponent, ok, raw in zip(values.tolist(), errors_rnd.tolist(), exps_rnd.tolist(),
+                                               finite.tolist(), errors.tolist()):
+        if not ok:
+            result.append(round_measure(value, raw))
+            continue
+        value_rounded = value if error == 0 else _round_to_exponent(value, exponent)
+        value_rounded = int(value_rounded) if value_rounded.is_integer() else value_rounded
+        error = int(error) if error.is_integer() else error
+        result.append((value_rounded, error))
+    return result
+
+
+# type(dm) -> conversión a DirectMeasure; se rellena en el primer uso de
+# cada tipo (DirectMeasure / CalculatedMeasure no pueden importarse a nivel
+# de módulo por ciclos).
+_TO_MEASURE: Dict[type, Callable[[Any], DirectMeasure]] = {}
 
 def operable_to_measure(dm: Operable) -> DirectMeasure:
+    fn = _TO_MEASURE.get(type(dm))
+    if fn is None:
+        fn = _TO_MEASURE[type(dm)] = _to_measure_slow(dm)
+    return fn(dm)
+
+def _to_measure_slow(dm: Operable) -> Callable[[Any], DirectMeasure]:
+    """Resuelve la conversión para type(dm) con la cadena de isinstance."""
     from .calculated_measure import CalculatedMeasure
     from .direct_measure import DirectMeasure
+    if isinstance(dm, DirectMeasure):
+        # Ya es una medida directa (inmutable): reconstruirla sólo repetía
+        # el redondeo y el procesado de unidades en cada operación
+        return _identity
     if isinstance(dm, Scalar):
-        dm = dm.value
+        return _from_scalar
     if isinstance(dm, int):
-        return DirectMeasure(dm, 0.0001)
-    elif isinstance(dm, float):
-        error = float(f"1e-{len(str(dm).split('.')[1])}")
-        return DirectMeasure(dm, error)
-    elif isinstance(dm, CalculatedMeasure):
-        return dm.as_direct_measure()
-    else:
-        return DirectMeasure(dm.value.value, dm.error.value, dm.units)
+        return lambda n: DirectMeasure(n, 0.0001)
+    if isinstance(dm, float):
+        return lambda x: DirectMeasure(x, float(f"1e-{len(str(x).split('.')[1])}"))
+    if isinstance(dm, CalculatedMeasure):
+        return lambda c: c.as_direct_measure()
+    return lambda m: DirectMeasure(m.value.value, m.error.value, m.units)
+
+def _identity(dm: DirectMeasure) -> DirectMeasure:
+    return dm
+
+def _from_scalar(s: Scalar) -> DirectMeasure:
+    return operable_to_measure(s.value)
 
 
 def get_prefix_and_composition(unit: Union[str,Unit]):
@@ -39,29 +39,30 @@ class MultiPlotter:
             num_points: Número de puntos para evaluar cada función.
         """
         x_values: np.ndarray = np.linspace(x_range[0], x_range[1], num_points)
-        plt.figure(figsize=(8, 5))
-        
+
         if self.plotters_dict is not None:
-            # Itera sobre el diccionario, usando las claves como etiquetas personalizadas.
-            for label, plotter in self.plotters_dict.items():
-                y_values: np.ndarray = plotter.evaluate(x_values)
-                plt.plot(x_values, y_values, label=label)
+            # Las claves del diccionario son las etiquetas personalizadas.
+            labels = list(self.plotters_dict)
+            plotters = list(self.plotters_dict.values())
         else:
-            # Itera sobre la lista de plotters, usando el etiquetado por defecto definido en cada objeto Plotter.
-            for plotter in self.plotters_list:  # type: ignore
-                y_values: np.ndarray = plotter.evaluate(x_values)
-                label = f"{plotter.dependent_var} = {plotter.rhs.subs(plotter.subs_dict)}"
-                plt.plot(x_values, y_values, label=label)
-        
+            # Etiquetado por defecto definido en cada objeto Plotter.
+            plotters = self.plotters_list  # type: ignore
+            labels = [f"{p.dependent_var} = {p.rhs.subs(p.subs_dict)}" for p in plotters]
+
+        # Todas las curvas comparten la malla: se evalúan en las filas de un
+        # único buffer y matplotlib las dibuja en una sola llamada (columnas de y_values.T)
+        y_values = np.empty((len(plotters), num_points))
+        for row, plotter in zip(y_values, plotters):
+            row[:] = plotter.evaluate(x_values)
+
+        plt.figure(figsize=(8, 5))
+        plt.plot(x_values, y_values.T)
+
         # Se utiliza la variable independiente del primer Plotter para etiquetar el eje X.
-        if self.plotters_dict is not None:
-            any_plotter: Plotter = next(iter(self.plotters_dict.values()))
-        else:
-            any_plotter = self.plotters_list[0]  # type: ignore
-        
+        any_plotter: Plotter = plotters[0]
         plt.xlabel(any_plotter.indep_variable)
         plt.ylabel(str(any_plotter.dependent_var))
         plt.title("Gráficas combinadas")
         plt.grid(True)
-        plt.legend()
+        plt.legend(labels)
         plt.show()
@@ -2,7 +2,7 @@ from matplotlib import pyplot as plt
 import sympy as sp
 import numpy as np
 import pandas as pd
-from typing import Dict, Union, Optional, Tuple, Callable
+from typing import Dict, List, Union, Optional, Tuple, Callable
 from ..quantity import Quantity
 from ..measure import DirectMeasure
 
@@ -75,13 +75,27 @@ class Plotter:
 
         Retorna:
             Arreglo numpy con los valores evaluados (Y) de la función, 
-            con la misma cantidad de elementos que x_values.
+            con la misma cantidad de elementos que x_values (también si la
+            expresión es constante).
         """
         ind_sym = sp.symbols(self.indep_variable)
         expr_evaluated = self.rhs.subs(self.subs_dict)
+        coeffs = self._poly_coeffs(expr_evaluated, ind_sym)
+        if coeffs is not None:
+            # Polinomio: esquema de Horner en C (una multiplicación y una suma
+            # por término) en lugar de evaluar cada potencia x**i
+            return np.polyval(coeffs, x_values)
         f = sp.lambdify(ind_sym, expr_evaluated, 'numpy')
         return f(x_values)
 
+    @staticmethod
+    def _poly_coeffs(expr: sp.Expr, sym: sp.Symbol) -> Optional[List[float]]:
+        """Coeficientes (de mayor a menor grado) si expr es un polinomio real en sym."""
+        try:
+            return [float(c) for c in sp.Poly(expr, sym).all_coeffs()]
+        except (sp.PolynomialError, TypeError):
+            return None
+
     def plot(self, x_range: Tuple[float, float], num_points: int = 100) -> None:
         """
         Genera y muestra el gráfico de la función evaluada en función de la variable independiente.
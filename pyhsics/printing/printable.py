@@ -17,6 +17,7 @@ class Printable(ABC):
       - __repr__() : Devuelve una cadena descriptiva.
       - display_latex() : Muestra la representación en LaTeX del objeto usando IPython.display.
     """
+    __slots__ = ()
     
     @abstractmethod
     def __str__(self) -> str:
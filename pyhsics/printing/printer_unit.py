@@ -1,8 +1,9 @@
 import re
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
-from ..units.fundamental_unit import FundamentalUnit, UNIT_ORDER
+from ..units.fundamental_unit import FundamentalUnit, UNIT_ORDER, UNIT_ORDER_SET
 from ..units import UnitDict, UnitAliasManager
+from ..units.unit_composition import UnitComposition
 from .helpers import to_superscript
 
 class UnitTextFormater:
@@ -15,10 +16,13 @@ class UnitTextFormater:
     """
 
     @classmethod
-    def lookup_alias(cls, units: UnitDict) -> Optional[str]:
+    def lookup_alias(cls, units: Union[UnitDict, UnitComposition]) -> Optional[str]:
         """
         If a known alias exists for this combination of fundamental units, return it.
+        A UnitComposition reuses its cached canonical key.
         """
+        if isinstance(units, UnitComposition):
+            return UnitAliasManager.get_alias(units.canonical_key)
         unit_set = frozenset(
             (unit, power)
             for unit, power in units.items()
@@ -36,19 +40,24 @@ class UnitTextFormater:
         if FundamentalUnit.DISTANCE in cleaned and FundamentalUnit.ANGLE in cleaned:
             cleaned[FundamentalUnit.ANGLE] = 0
             cleaned = {u: p for u, p in cleaned.items() if p != 0}
-        return sorted(
-            cleaned.items(),
-            key=lambda up: UNIT_ORDER.index(up[0]) if up[0] in UNIT_ORDER else float('inf')
-        )
+        # Recorrido lineal de UNIT_ORDER en lugar de sorted() con
+        # UNIT_ORDER.index por elemento; las unidades fuera del orden
+        # (p. ej. MONEY) van al final en su orden de inserción.
+        ordered = [(u, cleaned[u]) for u in UNIT_ORDER if u in cleaned]
+        if len(ordered) < len(cleaned):
+            ordered += [(u, p) for u, p in cleaned.items() if u not in UNIT_ORDER_SET]
+        return ordered
 
     @classmethod
-    def py_str(cls, units: UnitDict) -> str:
+    def py_str(cls, units: Union[UnitDict, UnitComposition]) -> str:
         """
         Return a human-readable plain string, using Unicode superscripts.
         E.g. kg·m²·s⁻¹
         """
         if alias := cls.lookup_alias(units):
             return alias
+        if isinstance(units, UnitComposition):
+            units = units.unit_dict
         parts: List[str] = []
         for unit, power in cls._sort_units(units):
             if power == 1:
@@ -59,12 +68,14 @@ class UnitTextFormater:
         return "·".join(parts) if parts else ""
 
     @classmethod
-    def latex_str(cls, units: UnitDict) -> str:
+    def latex_str(cls, units: Union[UnitDict, UnitComposition]) -> str:
         """
         Return a LaTeX-formatted string of units, e.g. \\text{kg} \\cdot \\text{m}^{2} / \\text{s}
         """
         if alias := cls.lookup_alias(units):
             return cls._from_alias(alias)
+        if isinstance(units, UnitComposition):
+            units = units.unit_dict
         parts = [cls._unit_to_latex(u, p) for u, p in cls._sort_units(units)]
         return " \\cdot ".join(parts) if parts else ""
 
@@ -1,12 +1,13 @@
 from typing import Dict, FrozenSet, List, Tuple, Union
 from .basic_typing import *
-from .unit_composition import UnitComposition
+from .unit_composition import UnitComposition, _intern_key
 
 class UnitAliasManager:
     """
     Maneja los alias para composiciones de unidades.
     """
     _aliases: Dict[FrozenSet[tuple[FundamentalUnit, RealLike]], List[str]] = {}
+    _version: int = 0   # Aumenta con cada cambio del registro (invalida cachés)
     
     def __getitem__(self, key: str) -> UnitDict:
         """
@@ -32,16 +33,18 @@ class UnitAliasManager:
         - alias: El alias a asociar, por ejemplo, "N" para newton.
         """
         if isinstance(units, str):
-            units = UnitComposition.from_str(units).unit_dict
+            units = UnitComposition.from_str(units)
         if isinstance(units, UnitComposition):
-            units = units.unit_dict
-
-        key = frozenset((unit, power) for unit, power in units.items() if power != 0)
+            key = units.canonical_key
+        else:
+            key = _intern_key(frozenset((unit, power) for unit, power in units.items() if power != 0))
         if key in cls._aliases:
             if alias not in cls._aliases[key]:
                 cls._aliases[key].insert(0, alias)
+                cls._version += 1
         else:
             cls._aliases[key] = [alias]
+            cls._version += 1
     
     @classmethod
     def add_aliases(cls, units: Union[str, UnitComposition, UnitDict], aliases: List[str]) -> None:
@@ -68,6 +71,14 @@ class UnitAliasManager:
         Devuelve el diccionario interno de alias.
         """
         return cls._aliases
+
+    @classmethod
+    def version(cls) -> int:
+        """
+        Contador de cambios del registro de alias. Permite a las cachés que
+        dependen de los alias (p. ej. la del parser) saber cuándo vaciarse.
+        """
+        return cls._version
     
     @classmethod
     def reset(cls, all: bool=False) -> None:
@@ -78,6 +89,7 @@ class UnitAliasManager:
         all: Si esta activado se borra y no se inician lo default. 
         """
         cls._aliases.clear()
+        cls._version += 1
         if not all:
             from .more_units import add_derived_units_to_alias_manager
             add_derived_units_to_alias_manager()
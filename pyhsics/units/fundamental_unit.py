@@ -40,6 +40,7 @@ UNIT_ORDER = [
     FundamentalUnit.SUBSTANCE_QUANTITY,
     FundamentalUnit.ONE,
 ]
+UNIT_ORDER_SET = frozenset(UNIT_ORDER)
 
 
 # Diccionario de prefijos SI (clave: prefijo, valor: factor numérico)
@@ -3,7 +3,7 @@ Módulo parser para unidades.
 
 Provee la conversión de cadenas de texto en objetos de unidades a través de prefijos SI y unidades personalizadas.
 """
-from typing import Optional, Dict, Any, Callable, Union
+from typing import Optional, Dict, Any, Callable, Tuple, Union
 from math import pi
 
 from .fundamental_unit import FundamentalUnit, PREFIXES_MAP
@@ -180,20 +180,23 @@ class UnitParser:
             next_term = self.term()
             if op == '*':
                 mult *= next_term.prefix
-                comp: UnitDict = self.merge(comp, next_term.unit_dict, factor=1)
             elif op == '/':
                 mult /= next_term.prefix
-                comp = self.merge(comp, next_term.unit_dict, factor=-1)
+            # Un término sólo numérico (p. ej. "1000") no aporta unidades:
+            # basta con plegar el coeficiente y se omite la fusión.
+            if next_term.unit_dict:
+                comp: UnitDict = self.merge(comp, next_term.unit_dict, factor=1 if op == '*' else -1)
         return PrefixedUnit(mult, comp)
 
     def term(self) -> PrefixedUnit:
         factor_unit = self.factor()  # Llamada única para obtener el factor
+        if not (self.current_token.type == UnitToken.OP and self.current_token.value == '**'):
+            return factor_unit
         mult, comp = factor_unit.prefix, factor_unit.unit_dict
-        if self.current_token.type == UnitToken.OP and self.current_token.value == '**':
-            self.eat(UnitToken.OP, '**')
-            exp = self.exponent()
-            mult = mult ** exp
-            comp = {unit: power * exp for unit, power in comp.items()}
+        self.eat(UnitToken.OP, '**')
+        exp = self.exponent()
+        mult = mult ** exp
+        comp = {unit: power * exp for unit, power in comp.items()}
         return PrefixedUnit(mult, comp)
 
     def factor(self) -> PrefixedUnit:
@@ -283,4 +286,37 @@ def alias_resolver(alias: str) -> PrefixedUnit:
     for key, alias_list in UnitAliasManager.aliases().items():
         if alias in alias_list:
             return PrefixedUnit(1.0, UnitComposition(dict(key)))
-    raise UnitParseError(f"Alias de unidad '{alias}' no encontrado.")
\ No newline at end of file
+    raise UnitParseError(f"Alias de unidad '{alias}' no encontrado.")
+
+
+# ---------------------------------------------------------------------
+# Caché de parseo
+# ---------------------------------------------------------------------
+FUNDAMENTAL_MAPPING: Dict[str, FundamentalUnit] = {unit.value: unit for unit in FundamentalUnit}
+
+_PARSE_CACHE_MAX = 1024
+_parse_cache: Dict[str, Tuple[Any, Tuple[Tuple[FundamentalUnit, RealLike], ...]]] = {}
+_parse_cache_version: int = -1
+
+
+def parse_units(text: str) -> PrefixedUnit:
+    """
+    Parsea `text` con FUNDAMENTAL_MAPPING y alias_resolver, memorizando el
+    resultado por cadena.
+
+    La caché se vacía cuando cambia el registro de alias
+    (UnitAliasManager.version()). Cada llamada devuelve una PrefixedUnit
+    nueva, ya que su unit_dict es mutable y no debe compartirse.
+    """
+    global _parse_cache_version
+    version = UnitAliasManager.version()
+    if version != _parse_cache_version or len(_parse_cache) >= _PARSE_CACHE_MAX:
+        _parse_cache.clear()
+        _parse_cache_version = version
+    cached = _parse_cache.get(text)
+    if cached is None:
+        result = UnitParser(text, FUNDAMENTAL_MAPPING, alias_resolver).parse()
+        cached = (result.prefix, tuple(result.unit_dict.items()))
+        _parse_cache[text] = cached
+    prefix, items = cached
+    return PrefixedUnit(prefix, dict(items))
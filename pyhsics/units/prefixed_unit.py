@@ -18,6 +18,11 @@ class PrefixedUnit(UnitComposition):
         object.__setattr__(self, 'prefix', prefix)
         object.__setattr__(self, 'unit_dict', units)
 
+    def __hash__(self) -> int:
+        # Igual a una UnitComposition con la misma clave sea cual sea el
+        # prefijo, así que el hash no puede depender de él
+        return hash(self.canonical_key)
+
     def __str__(self) -> str:
         base_str = UnitComposition.__str__(self)
         if self.prefix == 1.0:
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Any, ClassVar, Dict, FrozenSet, Optional, Tuple
 from IPython.display import display, Latex #type: ignore
 
 from ..printing.printable import Printable
@@ -28,6 +28,16 @@ class Unit(Printable):
     
     """
     alias_manager = UnitAliasManager
+    # Cachés de clase. Ambas dependen de los alias (a través de `formula`),
+    # así que se vacían cuando cambian (ver _sync_caches).
+    #  • _binop_cache: (op, operando_a, operando_b | exponente) -> Unit.
+    #    Evita repetir la fusión de exponentes y el formateo de `formula`
+    #    al combinar una y otra vez las mismas unidades.
+    #  • _intern: clave de composición -> Unit de prefijo 1 (from_unit_composition).
+    _binop_cache: ClassVar[Dict[Tuple[Any, ...], 'Unit']] = {}
+    _intern: ClassVar[Dict[Tuple[FrozenSet[Tuple[FundamentalUnit, RealLike]], RealLike], 'Unit']] = {}
+    _cache_version: ClassVar[int] = -1
+    _CACHE_MAX: ClassVar[int] = 1024
     formula: str
     prefix: ScalarLike
     composition: UnitComposition
@@ -39,11 +49,9 @@ class Unit(Printable):
         alias = None
         if "=" in formula:
             alias, formula = map(str.strip, formula.split("=", 1))
-        mapping: Dict[str, FundamentalUnit] = {unit.value: unit for unit in FundamentalUnit}
 
-        from .parser import UnitParser, alias_resolver    
-        parser = UnitParser(formula, mapping, alias_resolver)
-        result = parser.parse()
+        from .parser import parse_units
+        result = parse_units(formula)
     
         if alias:
             self.alias_manager.add_alias(result.unit_dict, alias)
@@ -73,6 +81,12 @@ class Unit(Printable):
     
     @classmethod
     def from_unit_composition(cls, unit_composition: 'UnitComposition') -> 'Unit':
+        # Internado: cada Quantity pasa por aquí, así que las composiciones
+        # iguales comparten una única Unit (y su `formula` ya formateada).
+        key = cls._composition_key(unit_composition)
+        cls._sync_caches()
+        if (interned := cls._intern.get(key)) is not None:
+            return interned
         prefix = 1
         composition = unit_composition
         new_unit = cls.__new__(cls)
@@ -81,6 +95,7 @@ class Unit(Printable):
         object.__setattr__(new_unit, "composition", composition)
         object.__setattr__(new_unit, "prefix", prefix)
         
+        cls._intern[key] = new_unit
         return new_unit
         
     def __str__(self) -> str:
@@ -89,9 +104,11 @@ class Unit(Printable):
 
     def _repr_latex_(self, name: Optional[str] = None) -> str:
         from ..printing.printer_unit import UnitTextFormater
-        return "$" + UnitTextFormater.latex_str(self.composition.unit_dict) + "$" 
+        return "$" + UnitTextFormater.latex_str(self.composition) + "$" 
     
     def __eq__(self, other: object) -> bool:
+        if self is other:               # Units internadas: comparación por identidad
+            return True
         if isinstance(other, Unit):
             units = self.composition == other.composition
             prefix = self.prefix == other.prefix
@@ -105,25 +122,57 @@ class Unit(Printable):
         return hash((self.formula, self.prefix))
     
     def __truediv__(self, other: 'Unit') -> 'Unit':
-        new = PrefixedUnit(
+        key = ('/', self._operand_key(), other._operand_key())
+        return self._cached(key) or self._store(key, PrefixedUnit(
             self.prefix / other.prefix,
             self.composition / other.composition
-        )
-        return Unit.from_prefixed_unit(new)
+        ))
     
     def __mul__(self, other: 'Unit') -> 'Unit':
-        new = PrefixedUnit(
+        key = ('*', self._operand_key(), other._operand_key())
+        return self._cached(key) or self._store(key, PrefixedUnit(
             self.prefix * other.prefix,
             self.composition * other.composition
-        )
-        return Unit.from_prefixed_unit(new)
+        ))
     
     def __pow__(self, other: RealLike) -> 'Unit':
-        new = PrefixedUnit(
+        key = ('**', self._operand_key(), (other, type(other)))
+        return self._cached(key) or self._store(key, PrefixedUnit(
             self.prefix ** other,
             self.composition ** other
-        )
-        return Unit.from_prefixed_unit(new)
+        ))
+
+    def _operand_key(self) -> Tuple[Any, ...]:
+        # El tipo del prefijo distingue 2 de 2.0 (se imprimen distinto)
+        return self._composition_key(self.composition), self.prefix, type(self.prefix)
+
+    @staticmethod
+    def _composition_key(composition: UnitComposition) -> Tuple[FrozenSet[Tuple[FundamentalUnit, RealLike]], RealLike]:
+        # canonical_key ignora ONE, pero UnitComposition.__eq__ no: sin su
+        # exponente dos composiciones distintas compartirían la entrada
+        return composition.canonical_key, composition.unit_dict.get(FundamentalUnit.ONE, 0)
+
+    @classmethod
+    def _sync_caches(cls) -> None:
+        """Vacía las cachés de clase si cambiaron los alias o están llenas."""
+        version = UnitAliasManager.version()
+        full = len(cls._binop_cache) >= cls._CACHE_MAX or len(cls._intern) >= cls._CACHE_MAX
+        if version != cls._cache_version or full:
+            cls._binop_cache.clear()
+            cls._intern.clear()
+            cls._cache_version = version
+
+    @classmethod
+    def _cached(cls, key: Tuple[Any, ...]) -> Optional['Unit']:
+        """Resultado memorizado para `key`, o None."""
+        cls._sync_caches()
+        return cls._binop_cache.get(key)
+
+    @classmethod
+    def _store(cls, key: Tuple[Any, ...], new: PrefixedUnit) -> 'Unit':
+        unit = cls.from_prefixed_unit(new)
+        cls._binop_cache[key] = unit
+        return unit
     
     def is_one(self):
         return (
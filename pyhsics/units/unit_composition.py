@@ -1,13 +1,25 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from collections import defaultdict
-from typing import Dict, Union
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Tuple, Union
 from IPython.display import display, Latex #type: ignore
 
 from ..printing.printable import Printable
 
 from .fundamental_unit import FundamentalUnit
-from .basic_typing import UnitDict
+from .basic_typing import UnitDict, RealLike
+
+
+# Claves canónicas internadas: composiciones iguales comparten el mismo
+# frozenset, de modo que las búsquedas en los diccionarios que las usan
+# (alias, cachés de Unit) se resuelven por identidad sin recorrerlo.
+_KEY_INTERN: Dict[FrozenSet[Tuple[FundamentalUnit, RealLike]], FrozenSet[Tuple[FundamentalUnit, RealLike]]] = {}
+_KEY_INTERN_MAX = 4096
+
+
+def _intern_key(key: FrozenSet[Tuple[FundamentalUnit, RealLike]]) -> FrozenSet[Tuple[FundamentalUnit, RealLike]]:
+    if len(_KEY_INTERN) >= _KEY_INTERN_MAX:
+        _KEY_INTERN.clear()
+    return _KEY_INTERN.setdefault(key, key)
 
 
 @dataclass(frozen=True, slots=True)
@@ -20,6 +32,7 @@ class UnitComposition(Printable):
     """
     
     unit_dict: UnitDict
+    _key: FrozenSet[Tuple[FundamentalUnit, RealLike]] = field(init=False, repr=False, compare=False)
 
     def __init__(self, unit_dict: Union[UnitDict, UnitComposition]) -> None:
         if isinstance(unit_dict, UnitComposition):
@@ -29,53 +42,121 @@ class UnitComposition(Printable):
         clean_units = {u: p for u, p in unit_dict.items() if p != 0}
         object.__setattr__(self, 'unit_dict', clean_units)
            
-    def __mul__(self, other: UnitComposition) -> UnitComposition:       
-        new_units = defaultdict(int, self.unit_dict)        
-        for unit, power in other.unit_dict.items():
-            new_units[unit] += power
-        return UnitComposition(dict(new_units))._clean()
+    @classmethod
+    def _make(cls, unit_dict: Dict[FundamentalUnit, RealLike]) -> UnitComposition:
+        """
+        Constructor interno: adopta `unit_dict` tal cual, sin copiarlo ni
+        filtrarlo. Sólo para diccionarios recién creados y ya sin ceros.
+        """
+        new = object.__new__(cls)
+        object.__setattr__(new, 'unit_dict', unit_dict)
+        return new
+
+    def __mul__(self, other: UnitComposition) -> UnitComposition:
+        # La composición adimensional es el elemento neutro: no hay nada que fusionar
+        if not other.unit_dict:
+            return self._as_composition()
+        if not self.unit_dict:
+            return other._as_composition()
+        return UnitComposition._make(self._merge(self.unit_dict, other.unit_dict, 1))
 
     def __rmul__(self, other: UnitComposition) -> UnitComposition:
         return self.__mul__(other)
 
-    def __truediv__(self, other: UnitComposition) -> UnitComposition:        
-        new_units = defaultdict(int, self.unit_dict)            
-        for unit, power in other.unit_dict.items():
-            new_units[unit] -= power
-        return UnitComposition(dict(new_units))._clean()
+    def __truediv__(self, other: UnitComposition) -> UnitComposition:
+        if not other.unit_dict:
+            return self._as_composition()
+        return UnitComposition._make(self._merge(self.unit_dict, other.unit_dict, -1))
 
     def __rtruediv__(self, other: FundamentalUnit) -> UnitComposition:
-        new_units: UnitDict = defaultdict(int, {other: 1})
-        for unit, power in self.unit_dict.items():
-            new_units[unit] -= power
-        return UnitComposition(dict(new_units))._clean()
+        return UnitComposition._make(self._merge({other: 1}, self.unit_dict, -1))
+
+    def _as_composition(self) -> UnitComposition:
+        """
+        La propia instancia si es una UnitComposition exacta; para subclases
+        (PrefixedUnit) una UnitComposition que comparte su unit_dict.
+        """
+        if type(self) is UnitComposition:
+            return self
+        return UnitComposition._make(self.unit_dict)
+
+    @staticmethod
+    def _merge(base: UnitDict, other: UnitDict, sign: int) -> Dict[FundamentalUnit, RealLike]:
+        """
+        Suma (sign=1) o resta (sign=-1) los exponentes de `other` sobre una copia
+        de `base` en una sola pasada, quitando los que se anulan.
+        """
+        new_units = dict(base)
+        get = new_units.get
+        for unit, power in other.items():
+            p = get(unit, 0) + sign * power
+            if p != 0:
+                new_units[unit] = p
+            else:
+                new_units.pop(unit, None)
+        return new_units
 
     def __pow__(self, exponent: float) -> UnitComposition:
         if isinstance(self.unit_dict, UnitComposition):
-            return (self.unit_dict ** exponent)._clean()
-        return UnitComposition({unit: power * exponent for unit, power in self.unit_dict.items()})._clean()
+            return self.unit_dict ** exponent
+        if exponent == 0:
+            return UnitComposition._make({})
+        if exponent == 1:
+            return self._as_composition()
+        return UnitComposition._make({unit: power * exponent for unit, power in self.unit_dict.items()})
 
     def __add__(self, other: UnitComposition) -> UnitComposition:
-        if self._clean().unit_dict.keys() != other._clean().unit_dict.keys():
+        # unit_dict nunca guarda exponentes nulos: no hace falta _clean()
+        if self.unit_dict.keys() != other.unit_dict.keys():
             raise ValueError("No se pueden sumar composiciones con unidades diferentes.")
         return self
 
+    @property
+    def canonical_key(self) -> FrozenSet[Tuple[FundamentalUnit, RealLike]]:
+        """
+        Clave canónica (sin ONE ni exponentes nulos) con la que se buscan
+        los alias. Se calcula la primera vez y queda guardada en la instancia.
+        """
+        try:
+            return self._key
+        except AttributeError:
+            key = frozenset(
+                (unit, power) for unit, power in self.unit_dict.items()
+                if unit != FundamentalUnit.ONE and power != 0
+            )
+            key = _intern_key(key)
+            object.__setattr__(self, '_key', key)
+            return key
+
     def _clean(self) -> UnitComposition:
         """Devuelve una nueva composición sin unidades con exponente 0."""
         return UnitComposition({unit: power for unit, power in self.unit_dict.items() if power != 0})
 
     def __str__(self) -> str:
         from ..printing.printer_unit import UnitTextFormater
-        return UnitTextFormater.py_str(self.unit_dict) # devuelve una str de python con los * como · y los exponentes como superindices
+        return UnitTextFormater.py_str(self) # devuelve una str de python con los * como · y los exponentes como superindices
 
     def _repr_latex_(self): # devuelve una string en formato laTex
         from ..printing.printer_unit import UnitTextFormater
-        return "$" + UnitTextFormater.latex_str(self.unit_dict) + "$" 
+        return "$" + UnitTextFormater.latex_str(self) + "$" 
         
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, UnitComposition):
             return NotImplemented
-        return self._clean().unit_dict == other._clean().unit_dict
+        # Las claves canónicas están internadas (y cachean su hash), así que
+        # casi siempre se resuelve por identidad o por hash distinto.
+        key, other_key = self.canonical_key, other.canonical_key
+        if key is not other_key and key != other_key:
+            return False
+        # La clave ignora ONE: es lo único que queda por comparar
+        one = FundamentalUnit.ONE
+        return self.unit_dict.get(one, 0) == other.unit_dict.get(one, 0)
+
+    def __hash__(self) -> int:
+        # Composiciones iguales tienen la misma clave canónica (ya cacheada)
+        return hash(self.canonical_key)
 
     @classmethod
     def from_str(cls, text: str) -> UnitComposition:
@@ -85,9 +166,5 @@ class UnitComposition(Printable):
         Ejemplo:
             UnitComposition.from_str("kg / m**2 * s**4 * s")
         """
-        from .parser import UnitParser, alias_resolver
-            
-        mapping: Dict[str, FundamentalUnit] = {unit.value: unit for unit in FundamentalUnit}
-        parser = UnitParser(text, mapping, alias_resolver)
-        result = parser.parse()
-        return result
+        from .parser import parse_units
+        return parse_units(text)
@@ -1,4 +1,20 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
+
+# Núcleo RREF en Cython (opcional): sólo se compila si Cython está
+# instalado, y un fallo de compilación no aborta la instalación.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [Extension(
+            "pyhsics.linalg.structures.matrix._rref_cy",
+            ["pyhsics/linalg/structures/matrix/_rref_cy.pyx"],
+            extra_compile_args=["-O3"],
+            optional=True,
+        )],
+        language_level=3,
+    )
+except ImportError:
+    ext_modules = []
 
 setup(
     name='pyhsics',  # Nombre de la librería
@@ -7,6 +23,7 @@ setup(
     install_requires=[  # Dependencias externas, si las hay
         # 'numpy',  # Ejemplo de dependencia
     ],
+    ext_modules=ext_modules,
     test_suite='tests',  # Especificar dónde están los tests
     author='Pablo Cabeza',
 )
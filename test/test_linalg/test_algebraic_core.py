@@ -38,6 +38,11 @@ class TestAlgebraicOps(unittest.TestCase):
         with self.assertRaises(ValueError):
             ac.AlgebraicOps.add_vector_like([1, 2], [3])
 
+    def test_sub_vector_like(self) -> None:
+        self.assertEqual(ac.AlgebraicOps.sub_vector_like([4, 5, 6], [1, 2, 3]), [3, 3, 3])
+        with self.assertRaises(ValueError):
+            ac.AlgebraicOps.sub_vector_like([1, 2], [3])
+
     def test_add_matrix_like(self) -> None:
         m1 = [[1, 2], [3, 4]]
         m2 = [[5, 6], [7, 8]]
@@ -113,6 +118,16 @@ class TestT2AlgebraicAndRounding(unittest.TestCase):
         with self.assertRaises(TypeError):
             ac.T2Algebraic("not supported")  # tipo no válido
 
+    def test_T2Algebraic_dispatch_cache(self) -> None:
+        ac.T2Algebraic(1.5)
+        self.assertIn(float, ac._T2ALG_DISPATCH)
+        # una lista cacheada sigue distinguiendo vector de matriz
+        self.assertEqual(type(ac.T2Algebraic([1, 2])).__name__, "Vector")
+        self.assertEqual(type(ac.T2Algebraic([[1], [2]])).__name__, "Matrix")
+        with self.assertRaises(TypeError):
+            ac.T2Algebraic(object())
+        self.assertNotIn(object, ac._T2ALG_DISPATCH)
+
     def test_round_T_Scalar_real(self) -> None:
         self.assertEqual(ac.round_T_Scalar(3.14159, 3), 3.142)
 
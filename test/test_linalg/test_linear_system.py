@@ -51,6 +51,18 @@ class TestLinearSystemSolve(unittest.TestCase):
         sol = sys.solve()
         self.assertIsNone(sol)
 
+    def test_tiny_leading_pivot(self) -> None:
+        # Con el primer pivote no nulo (1e-20) la eliminación pierde x0 por
+        # cancelación; el pivoteo parcial elige la fila con |a| máximo.
+        A = Matrix([[1e-20, 1], [1, 1]])
+        b = Vector([1, 2])
+        sol = LinearSystem(A, b).solve()
+        self.assertIsInstance(sol, Vector)
+        self.assertAlmostEqual(sol.value[0], 1.0)
+        self.assertAlmostEqual(sol.value[1], 1.0)
+        ref = A.hstack(b).row_echelon_form()
+        self.assertAlmostEqual(ref.value[1][2], 1.0)
+
     def test_infinite_solutions(self) -> None:
         # rank 2 < 3 vars
         A = Matrix([[1, 0, 0], [0, 1, 0], [0, 0, 0]])
@@ -63,6 +75,22 @@ class TestLinearSystemSolve(unittest.TestCase):
         expected = {tuple(v.value) for v in sols}
         self.assertIn((0, 0, 1), expected)
 
+    def test_singular_float_system(self) -> None:
+        # Compatible e indeterminado: el residuo de redondeo en la última
+        # fila no debe convertirse en pivote (y el sistema en incompatible)
+        A = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        sols = LinearSystem(A, Vector([1, 2, 3])).solve()
+        self.assertIsInstance(sols, list)
+        self.assertIn(Vector([1, -2, 1]), sols)
+
+    def test_parse_equations_terms(self) -> None:
+        # Signos, decimales, '*' opcional y constantes en ambos lados
+        sys = LinearSystem.parse_equations(["-x - 2.5*y + 4 = .5y", "2x+-y = 1 - 3"])
+        self.assertEqual(sys.value.value, [[-1.0, -3.0], [2.0, -1.0]])
+        self.assertEqual(sys.B.value, [-4.0, -2.0])
+        with self.assertRaises(ValueError):
+            LinearSystem.parse_equations(["2x y$ = 1"])
+
 
 
 class TestLinearSystemPrinter(unittest.TestCase):
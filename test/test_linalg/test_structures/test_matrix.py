@@ -1,6 +1,8 @@
 # tests/test_matrix.py
 import unittest
 
+import numpy as np
+
 from pyhsics.linalg.structures import Scalar, Vector, Point, Matrix
 
 class TestMatrixInitialization(unittest.TestCase):
@@ -85,12 +87,41 @@ class TestMatrixArithmetic(unittest.TestCase):
                            [7*9+8*6+9*3, 7*8+8*5+9*2, 7*7+8*4+9*1]])
         self.assertEqual(C, expected)
 
+    def test_mul_matrix_float_fast_path(self) -> None:
+        A = Matrix([[0.5, 1.5], [2.0, -1.0], [1.0, 0.25]])
+        B = Matrix([[2.0, 0.0, 1.0], [4.0, 1.0, -2.0]])
+        C = A * B
+        self.assertEqual(C.value, [[7.0, 1.5, -2.5], [0.0, -1.0, 4.0], [3.0, 0.25, 0.5]])
+        self.assertTrue(all(type(x) is float for row in C.value for x in row))
+        self.assertEqual((self.A * self.B).value[0], [30, 24, 18])   # ints: camino exacto
+        with self.assertRaises(ValueError):
+            _ = A * A
+
     def test_mul_point(self) -> None:
         p = Point([1, 2, 3])
         result = self.A * p
         self.assertIsInstance(result, Point)
         self.assertEqual(result.value, [14, 32, 50])
 
+    def test_pow(self) -> None:
+        F = Matrix([[1, 1], [1, 0]])              # Fibonacci
+        self.assertEqual((F ** 10).value, [[89, 55], [55, 34]])
+        self.assertEqual((F ** Scalar(1)).value, F.value)
+        self.assertEqual((F ** 0).value, [[1, 0], [0, 1]])
+        A = Matrix([[2, 0], [0, 4]])
+        self.assertEqual((A ** -2).value, [[0.25, 0], [0, 0.0625]])
+        with self.assertRaises(ValueError):
+            _ = Matrix([[1, 2, 3], [4, 5, 6]]) ** 2
+        with self.assertRaises(TypeError):
+            _ = F ** 0.5
+        with self.assertRaises(TypeError):
+            _ = F ** True
+        singular = Matrix([[1, -4, -1], [3, -4, -4], [3, 4, -5]])
+        with self.assertRaises(ValueError):
+            _ = singular ** -1
+        with self.assertRaises(ValueError):
+            _ = singular ** -3
+
     def test_div_scalar(self) -> None:
         C = self.A / 2
         self.assertEqual(C.value, [[0.5, 1, 1.5], [2, 2.5, 3], [3.5, 4, 4.5]])
@@ -114,18 +145,123 @@ class TestMatrixRowEchelonAndRank(unittest.TestCase):
             for j in range(i):
                 self.assertAlmostEqual(ref.value[i][j], 0.0, places=6)
 
+    def test_row_echelon_form_pivots_on_largest_entry(self) -> None:
+        ref = Matrix([[0, 1], [2, 4]]).row_echelon_form()
+        self.assertEqual(ref.value, [[1.0, 2.0], [0.0, 1.0]])
+
     def test_reduced_row_echelon_form(self) -> None:
         rref = self.M.reduced_row_echelon_form()
         # la forma reducida debe tener 1s en la diagonal
         diag = [rref.value[i][i] for i in range(3)]
         self.assertTrue(all(abs(d - 1.0) < 1e-6 for d in diag))
 
+    def test_is_high_triang(self) -> None:
+        # Exige ceros en la diagonal y por debajo (j <= i)
+        self.assertTrue(Matrix([[0, 1], [0, 0]]).is_high_triang())
+        self.assertFalse(Matrix([[0, 1], [2, 0]]).is_high_triang())
+        self.assertFalse(Matrix([[1, 2], [0, 3]]).is_high_triang())
+
+    def test_ref_rref_exact_entries(self) -> None:
+        from fractions import Fraction as F
+        from pyhsics.linalg.structures.matrix.matrix_methods import MatrixMethods
+        A = Matrix([[F(2), F(4), F(1)], [F(1), F(3), F(2)]])   # camino genérico
+        self.assertEqual(MatrixMethods.row_echelon_form(A).value,
+                         [[1, 2, F(1, 2)], [0, 1, F(3, 2)]])
+        self.assertEqual(MatrixMethods.reduced_row_echelon_form(A).value,
+                         [[1, 0, F(-5, 2)], [0, 1, F(3, 2)]])
+
+    def test_numeric_array_cached(self) -> None:
+        from pyhsics.linalg.structures.matrix.matrix_methods import _to_ndarray
+        arr = self.M._array
+        self.assertIs(arr, self.M._array)
+        self.assertEqual(arr.dtype, np.float64)
+        self.assertFalse(arr.flags.writeable)
+        work = _to_ndarray(self.M)
+        work[0, 0] = 99.0                       # copia de trabajo independiente
+        self.assertEqual(self.M._array[0, 0], self.M.value[0][0])
+        self.assertIsNone(Matrix([[2**70, 1], [0, 1]])._array)
+
+    def test_rref_batched_matches_single(self) -> None:
+        from pyhsics.linalg.structures.matrix.matrix_methods import MatrixMethods
+        mats = [[[2, 4, 1], [6, 9, 5], [3, 7, 8]],
+                [[1, 2, 3], [2, 4, 6], [3, 5, 7]],
+                [[0, 0, 1], [0, 0, 2], [0, 0, 3]],
+                # Singulares: la eliminación en float deja residuos ~1e-16
+                [[1, 2, 3], [4, 5, 6], [7, 8, 9]],
+                [[1, -4, -1], [3, -4, -4], [3, 4, -5]]]
+        stacked = MatrixMethods.rref_batched(np.array(mats, dtype=float))
+        self.assertEqual(stacked[4].tolist(), [[1, 0, -1.5], [0, 1, -0.125], [0, 0, 0]])
+        for M, R in zip(mats, stacked):
+            expected = Matrix(M).reduced_row_echelon_form().value
+            for row_r, row_e in zip(R.tolist(), expected):
+                for a, b in zip(row_r, row_e):
+                    self.assertAlmostEqual(a, b, places=9)
+
     def test_rank(self) -> None:
         self.assertEqual(self.M.rank(), 3)
         # hacer dos filas colineales
         M2 = Matrix([[1, 2, 3], [2, 4, 6], [3, 5, 7]])
         self.assertEqual(M2.rank(), 2)
 
+    def test_singular_rank_and_ker(self) -> None:
+        # En coma flotante la eliminación deja residuos ~1e-16 donde debería
+        # haber ceros: no pueden contar como pivote
+        A = Matrix([[1, -4, -1], [3, -4, -4], [3, 4, -5]])
+        self.assertEqual(A.rank(), 2)
+        self.assertEqual(Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]]).rank(), 2)
+        ker = A.ker()
+        self.assertIsInstance(ker, list)
+        self.assertEqual(len(ker), 1)
+        self.assertEqual(ker[0], Vector([12, 1, 8]))
+        rows = (A * ker[0]).value
+        self.assertTrue(all(abs(x) < 1e-9 for x in rows))
+
+    def test_row_echelon_form_singular(self) -> None:
+        S = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        self.assertEqual(S.row_echelon_form().value[2], [0.0, 0.0, 0.0])
+        P, B = S.row_echelon_form(return_base=True)
+        self.assertEqual(B.value[2], [0.0, 0.0, 0.0])
+        self.assertTrue(all(abs(x) < 10 for row in P.value for x in row))
+        from pyhsics.linalg.structures.matrix.matrix_methods import MatrixMethods
+        self.assertEqual(MatrixMethods.det(Matrix([[1, -4, -1], [3, -4, -4], [3, 4, -5]])).value, 0)
+
+    def test_rref_kernels_singular(self) -> None:
+        from pyhsics.linalg.structures.matrix import matrix_methods_numba as mmn
+        from pyhsics.linalg.structures.matrix.matrix_methods import _rref_numeric
+        A = np.array([[1, -4, -1], [3, -4, -4], [3, 4, -5]], dtype=float)
+        kernels = [_rref_numeric] + [k for k in (mmn._rref_f64, mmn._rref_f64_parallel) if k is not None]
+        for kernel in kernels:
+            R = A.copy()
+            kernel(R)
+            self.assertEqual(R[2].tolist(), [0.0, 0.0, 0.0])
+            self.assertEqual(R[:, 0].tolist(), [1.0, 0.0, 0.0])
+            self.assertEqual(R[:, 1].tolist(), [0.0, 1.0, 0.0])
+
+
+try:  # extensión opcional: sólo existe si se compiló con Cython
+    from pyhsics.linalg.structures.matrix._rref_cy import rref_f64 as _rref_f64_cy
+except ImportError:
+    _rref_f64_cy = None
+
+
+@unittest.skipIf(_rref_f64_cy is None, "extensión Cython _rref_cy no compilada")
+class TestRrefCython(unittest.TestCase):
+    def test_matches_numpy_kernel(self) -> None:
+        from pyhsics.linalg.structures.matrix.matrix_methods import _rref_numeric
+        rng = np.random.default_rng(0)
+        for shape in [(3, 3), (4, 6), (6, 4)]:
+            A = rng.standard_normal(shape)
+            R = A.copy()
+            _rref_f64_cy(R)
+            np.testing.assert_allclose(R, _rref_numeric(A.copy()), atol=1e-12)
+
+    def test_singular(self) -> None:
+        R = np.array([[1, -4, -1], [3, -4, -4], [3, 4, -5]], dtype=float)
+        _rref_f64_cy(R)
+        self.assertEqual(R[2].tolist(), [0.0, 0.0, 0.0])
+        self.assertEqual(R[:, 0].tolist(), [1.0, 0.0, 0.0])
+        self.assertEqual(R[:, 1].tolist(), [0.0, 1.0, 0.0])
+
 
 class TestMatrixDeterminantInverseTrace(unittest.TestCase):
     def setUp(self) -> None:
@@ -138,6 +274,13 @@ class TestMatrixDeterminantInverseTrace(unittest.TestCase):
         # cálculo manual: 4*(6*9-1*5) -7*(3*9-1*2)+2*(3*5-6*2) = 4*49 -7*25 +2*3 = 196-175+6 = 27
         self.assertEqual(det.value, 27)
 
+    def test_matrix_methods_det(self) -> None:
+        from pyhsics.linalg.structures.matrix.matrix_methods import MatrixMethods
+        self.assertAlmostEqual(MatrixMethods.det(self.M).value, 27)
+        # un intercambio de filas cambia el signo
+        self.assertAlmostEqual(MatrixMethods.det(Matrix([[0, 1], [1, 0]])).value, -1)
+        self.assertEqual(MatrixMethods.det(Matrix([[1, 2], [2, 4]])).value, 0)
+
     def test_trace_and_is_squared(self) -> None:
         self.assertTrue(self.M.is_squared)
         self.assertEqual(self.M.trace.value, 4 + 6 + 9)
@@ -156,6 +299,9 @@ class TestMatrixDeterminantInverseTrace(unittest.TestCase):
         singular = Matrix([[1, 2, 3], [2, 4, 6], [3, 6, 9]])
         with self.assertRaises(ValueError):
             singular.inv()
+        # Singular sólo tras redondeo: el residuo no debe hacerla invertible
+        with self.assertRaises(ValueError):
+            Matrix([[1, -4, -1], [3, -4, -4], [3, 4, -5]]).inv()
 
 
 class TestMatrixMiscellaneous(unittest.TestCase):
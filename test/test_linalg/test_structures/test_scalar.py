@@ -22,6 +22,8 @@ class TestScalarBasic(unittest.TestCase):
     def test_is_zero_and_is_identity(self) -> None:
         self.assertTrue(Scalar(0).is_zero())
         self.assertFalse(Scalar(1e-12).is_zero())
+        self.assertTrue(Scalar(0j).is_zero())
+        self.assertFalse(Scalar(1e-300j).is_zero())
         self.assertTrue(Scalar(1).is_identity())
         self.assertFalse(Scalar(2).is_identity())
 
@@ -59,6 +61,15 @@ class TestScalarArithmetic(unittest.TestCase):
         self.assertIsInstance(result, Matrix)
         self.assertEqual(result.value, [[3, 6], [9, 12]])
 
+    def test_mul_dispatch_cache(self) -> None:
+        s = Scalar(2)
+        for _ in range(2):                      # 2ª vuelta: manejador memorizado
+            self.assertEqual((s * 3).value, 6)
+            self.assertEqual((s * Vector([1, 2])).value, [2, 4])
+        self.assertIn(int, Scalar._mul_dispatch)
+        self.assertIn(Vector, Scalar._mul_dispatch)
+        self.assertNotIn(str, Scalar._mul_dispatch)
+
     def test_mul_invalid(self) -> None:
         s = Scalar(2)
         with self.assertRaises(TypeError):
@@ -98,6 +109,26 @@ class TestScalarPower(unittest.TestCase):
         e = Scalar(2)
         self.assertEqual((s ** e).value, 25)
 
+    def test_pow_small_int_fast_path(self) -> None:
+        for n in range(8):
+            self.assertEqual((Scalar(3) ** n).value, 3 ** n)
+            self.assertAlmostEqual((Scalar(1.5) ** n).value, 1.5 ** n)
+        self.assertIsInstance((Scalar(2.0) ** 0).value, float)
+        # Floats: el mismo resultado que pow(), bit a bit
+        for base in (1.1, 0.1, -2.7):
+            for n in range(8):
+                self.assertEqual((Scalar(base) ** n).value, base ** n)
+        self.assertEqual((Scalar(True) ** 2).value, 1)
+        self.assertIs(type((Scalar(True) ** 0).value), int)
+
+    def test_pow_zero_symbolic(self) -> None:
+        import sympy as sp
+        x = sp.Symbol("x")
+        for base in (x, x ** 2, sp.sqrt(2)):
+            self.assertEqual((Scalar(base) ** 0).value, 1)
+        self.assertEqual((Scalar(x) ** 2).value, x ** 2)
+        self.assertEqual((Scalar(2) ** 10).value, 1024)
+
     def test_pow_invalid(self) -> None:
         with self.assertRaises(TypeError):
             _ = Scalar(2) ** [1, 2]  # invalid exponent type
@@ -1,8 +1,13 @@
 # tests/test_vector.py
 
+import os
 import unittest
+from unittest import mock
+
+import numpy as np
 
 from pyhsics.linalg.structures import Scalar, Vector, Point, Matrix
+from pyhsics.linalg.structures import vector_numba
 
 
 class TestVectorBasic(unittest.TestCase):
@@ -13,6 +18,28 @@ class TestVectorBasic(unittest.TestCase):
         self.assertListEqual(list(v), [1, 2, 3])
         self.assertEqual(v[0], 1)
 
+    def test_init_copies_and_ndarray(self) -> None:
+        import numpy as np
+        data = [1, 2, 3]
+        v = Vector(data)
+        data[0] = 99
+        self.assertEqual(v.value, [1, 2, 3])            # copia defensiva
+        w = Vector(np.array([1.5, 2.5]))
+        self.assertEqual(w.value, [1.5, 2.5])
+        self.assertTrue(all(type(x) is float for x in w.value))
+
+    def test_slots_and_pickle(self) -> None:
+        import pickle
+        v = Vector([1.5, 2.5, 3.5])
+        self.assertFalse(hasattr(v, "__dict__"))
+        w = pickle.loads(pickle.dumps(v))
+        self.assertEqual(w.value, v.value)
+        self.assertEqual(hash(w), hash(v))
+        # Las cachés no viajan en el pickle
+        _ = v._array
+        w = pickle.loads(pickle.dumps(v))
+        self.assertFalse(hasattr(w, "_array_cache") or hasattr(w, "_hash_cache"))
+
     def test_str_and_repr_latex(self) -> None:
         v = Vector([1.1, 2.2])
         # should not raise
@@ -31,12 +58,44 @@ class TestVectorArithmetic(unittest.TestCase):
         self.assertEqual((v1 - v2).value, [-2, -2])
         self.assertEqual((-v1).value, [-1, -2])
 
+    def test_r3_kernels(self) -> None:
+        v1 = Vector([1, 2.5, 3])
+        v2 = Vector([4, 5, 6j])
+        self.assertEqual((v1 + v2).value, [5, 7.5, 3 + 6j])
+        self.assertEqual((v1 - v2).value, [-3, -2.5, 3 - 6j])
+        self.assertEqual((v1 * 2).value, [2, 5.0, 6])
+        with self.assertRaises(ValueError):
+            _ = v1 + Vector([1, 2])
+
+    def test_unrolled_kernels_all_dims(self) -> None:
+        for n in range(1, 12):
+            a = list(range(1, n + 1))
+            b = [2 * x + 0.5 for x in a]
+            self.assertEqual((Vector(a) + Vector(b)).value, [x + y for x, y in zip(a, b)])
+            self.assertEqual((Vector(a) - Vector(b)).value, [x - y for x, y in zip(a, b)])
+            self.assertEqual((Vector(a) * 3).value, [3 * x for x in a])
+            self.assertEqual(Vector(a).dot(Vector(b)).value, sum(x * y for x, y in zip(a, b)))
+
+    def test_axpy(self) -> None:
+        x = Vector([1, 2, 3])
+        v = Vector([4, 5, 6])
+        self.assertEqual(x.axpy(2, v).value, [6, 9, 12])
+        self.assertEqual(x.axpy(Scalar(-1), v).value, (v - x).value)
+        big_x = Vector([1.0] * 20)
+        big_v = Vector([0.5] * 20)
+        self.assertEqual(big_x.axpy(0.1, big_v).value, [0.6] * 20)
+        with self.assertRaises(ValueError):
+            _ = x.axpy(1, Vector([1, 2]))
+
     def test_add_point(self) -> None:
         p = Point([1, 2, 3])
         v = Vector([4, 5, 6])
         res = v + p
         self.assertIsInstance(res, Point)
         self.assertEqual(res.value, [5, 7, 9])
+        diff = v - p
+        self.assertIsInstance(diff, Point)
+        self.assertEqual(diff.value, [3, 3, 3])
 
     def test_mul_scalar(self) -> None:
         v = Vector([1, 2, 3])
@@ -65,6 +124,14 @@ class TestVectorArithmetic(unittest.TestCase):
         # should compute v1·v2 = 0
         self.assertEqual(v1.dot(v2).value, 0)
 
+    def test_dot_default_form_any_dim(self) -> None:
+        # La forma euclídea no queda fijada a la dimensión del primer uso
+        self.assertEqual(Vector([1, 2]).dot(Vector([1, 2])).value, 5)
+        self.assertEqual(Vector([1, 2, 3]).dot(Vector([1, 2, 3])).value, 14)
+        self.assertIsNone(Vector._dot_product_matrix)
+        big = Vector([0.5] * 5000)
+        self.assertAlmostEqual(big.dot(big).value, 1250.0)
+
     def test_dot_custom_form(self) -> None:
         # custom bilinear form [[2,0],[0,3]]
         form = Matrix([[2, 0], [0, 3]])
@@ -74,6 +141,15 @@ class TestVectorArithmetic(unittest.TestCase):
         # v1ᵀ M v2 = [2,4]·[[2,0],[0,3]]·[3,4] = [2,4]·[6,12] = 30
         self.assertEqual(v1.dot(v2).value, 30)
 
+    def test_dot_rectangular_form(self) -> None:
+        # w · (M·v) con M de 3×2
+        form = Matrix([[1, 0], [0, 1], [1, 1]])
+        v = Vector([1, 2])
+        w = Vector([3, 4, 5])
+        self.assertEqual(v.dot(w, form=form).value, 26)
+        with self.assertRaises(ValueError):
+            _ = w.dot(v, form=form)
+
     def test_dot_invalid_dim(self) -> None:
         v1 = Vector([1, 2, 3])
         v2 = Vector([4, 5])
@@ -90,6 +166,22 @@ class TestVectorArithmetic(unittest.TestCase):
         self.assertAlmostEqual(norm.value[0], 3/5)
         self.assertAlmostEqual(norm.value[1], 4/5)
 
+    def test_float_fast_path(self) -> None:
+        n = Vector._NUMPY_MIN_LEN
+        a = Vector([float(i) for i in range(n)])
+        b = Vector([0.5] * n)
+        s = a + b
+        self.assertEqual(s.value, [i + 0.5 for i in range(n)])
+        self.assertTrue(all(type(x) is float for x in s.value))
+        self.assertIs(s._array, s._array)
+        self.assertEqual((a * 2.0).value, [2.0 * i for i in range(n)])
+        self.assertEqual((-b).value, [-0.5] * n)
+        self.assertAlmostEqual(a.dot(b).value, 0.5 * sum(range(n)))
+        self.assertIsInstance(a.dot(b).value, float)
+        ints = Vector(list(range(n)))
+        self.assertEqual((ints + ints).value, [2 * i for i in range(n)])   # ints: camino exacto
+        self.assertTrue(all(type(x) is int for x in (ints + ints).value))
+
     def test_norm_zero_vector(self) -> None:
         with self.assertRaises(ValueError):
             Vector([0, 0, 0]).norm()
@@ -132,6 +224,36 @@ class TestVectorConstructors(unittest.TestCase):
         self.assertTrue(all(isinstance(x, (int, float)) for x in r))
         self.assertTrue(all(isinstance(x, (int, float)) for x in rn))
 
+    def test_rand_randn_large(self) -> None:
+        r = Vector.rand(100)
+        rn = Vector.randn(100)
+        self.assertEqual((len(r), len(rn)), (100, 100))
+        self.assertTrue(all(type(x) is float and 0 <= x < 1 for x in r))
+        self.assertTrue(all(type(x) is float for x in rn))
+        self.assertEqual(r._array.tolist(), r.value)
+
+    def test_rand_randn_seeded(self) -> None:
+        """random.seed reproduce vectores cortos y largos por igual."""
+        import random
+        for n in (3, 5, 100, 1000):
+            random.seed(1234)
+            first = (Vector.rand(n).value, Vector.randn(n).value)
+            random.seed(1234)
+            self.assertEqual((Vector.rand(n).value, Vector.randn(n).value), first)
+
+
+class TestVectorPredicates(unittest.TestCase):
+    def test_is_zero(self) -> None:
+        self.assertTrue(Vector([0, 0.0, 0j]).is_zero())
+        self.assertTrue(Vector([0]).is_zero())
+        self.assertFalse(Vector([0, 1e-300, 0]).is_zero())
+        self.assertFalse(Vector([0.0] * 99 + [float('nan')]).is_zero())
+
+    def test_is_identity(self) -> None:
+        self.assertTrue(Vector([1, 1.0, 1 + 0j]).is_identity())
+        self.assertTrue(Vector([1]).is_identity())
+        self.assertFalse(Vector([1] * 50 + [2]).is_identity())
+
 
 class TestVectorAccessors(unittest.TestCase):
     def test_xyz_properties(self) -> None:
@@ -144,6 +266,16 @@ class TestVectorAccessors(unittest.TestCase):
     def test_z_property_error(self) -> None:
         with self.assertRaises(AttributeError):
             _ = Vector([1, 2]).z
+        with self.assertRaises(AttributeError):
+            _ = Vector([1, 2]).zv
+
+    def test_raw_xyz_properties(self) -> None:
+        v = Vector([7, 8.5, 9])
+        self.assertEqual((v.xv, v.yv, v.zv), (7, 8.5, 9))
+        self.assertIs(type(v.yv), float)
+        # Los accesos envueltos siguen dando Scalar con la misma componente
+        self.assertIs(type(v.y), Scalar)
+        self.assertIs(v.y.value, v.yv)
 
     def test_point_conversion(self) -> None:
         v = Vector([1, 2, 3])
@@ -166,12 +298,83 @@ class TestEqualityAndHash(unittest.TestCase):
         self.assertFalse(v1 == v2)
         self.assertTrue(v1 != v2)
 
+    def test_equality_matches_rank(self) -> None:
+        pairs = [
+            ([1, 2, 3], [-2, -4, -6]),
+            ([0, 0, 0], [1, 2, 3]),
+            ([1, 2, 3], [1, 2, 4]),
+            ([0, 5], [0, -1]),
+            # Magnitudes pequeñas: la tolerancia es relativa, no absoluta
+            ([1e-6, 0], [0, 1e-6]),
+            ([1e-11, 0], [0, 1]),
+            ([1e-9, 2e-9], [3e-9, 6e-9]),
+        ]
+        for a, b in pairs:
+            v1, v2 = Vector(a), Vector(b)
+            rank = Matrix.from_vecs([v1, v2]).rank()
+            self.assertEqual(v1 == v2, rank < 2)
+            self.assertEqual(Vector.are_linear_indep(v1, v2), rank == 2)
+        self.assertFalse(Vector([1, 2]) == Vector([1, 2, 0]))
+        with self.assertRaises(ValueError):
+            Vector.are_linear_indep(Vector([1, 2]), Vector([1, 2, 0]))
+        # Ruido de coma flotante: se sigue considerando colineal
+        self.assertTrue(Vector([1.0, 1e-3, 0.0]) == Vector([2.0, 2e-3, 1e-12]))
+        self.assertTrue(Vector([1e-6, 1e-9, 0.0]) == Vector([2e-6, 2e-9, 1e-18]))
+        v, w = Vector([1e-6, 0]), Vector([0, 1e-6])
+        self.assertNotEqual(v, w)
+        self.assertEqual(len({v, w}), 2)
+
+    def test_equality_symbolic(self) -> None:
+        # Componentes simbólicas: sin orden por módulo, se usa el rango exacto
+        import sympy as sp
+        x, y = sp.symbols("x y")
+        self.assertTrue(Vector([x, 1]) == Vector([2 * x, 2]))
+        self.assertFalse(Vector([x, y]) == Vector([1, 2]))
+        self.assertTrue(Vector([x, y]) != Vector([1, 2]))
+        self.assertTrue(Vector([sp.sqrt(2), 1]) == Vector([2, sp.sqrt(2)]))
+
+    def test_are_linear_indep_micro_scale(self) -> None:
+        # Geometría en µm / µs: la independencia no depende de la escala
+        um = 1e-6
+        self.assertTrue(Vector.are_linear_indep(Vector([um, 0, 0]), Vector([0, um, 0])))
+        self.assertTrue(Vector.are_linear_indep(Vector([3 * um, 4 * um, 0]), Vector([4 * um, -3 * um, 0])))
+        self.assertFalse(Vector.are_linear_indep(Vector([um, 2 * um, 3 * um]), Vector([-2 * um, -4 * um, -6 * um])))
+        self.assertFalse(Vector.are_linear_indep(Vector([0, 0, 0]), Vector([0, um, 0])))
+
+    def test_are_linear_indep_symbolic(self) -> None:
+        import sympy as sp
+        x, y = sp.symbols("x y")
+        self.assertFalse(Vector.are_linear_indep(Vector([x, 1]), Vector([2 * x, 2])))
+        self.assertTrue(Vector.are_linear_indep(Vector([x, y]), Vector([1, 2])))
+        self.assertTrue(Vector.are_linear_indep(Vector([x, 0]), Vector([0, x])))
+
     def test_hash_consistency(self) -> None:
         v = Vector([3, 0, 4])
         h1 = hash(v)
         h2 = hash(v)
         self.assertEqual(h1, h2)
 
+    def test_hash_consistent_with_eq(self) -> None:
+        v = Vector([1, -2, 3])
+        for w in (Vector([2, -4, 6]), Vector([-0.5, 1.0, -1.5]), Vector([0.1, -0.2, 0.3])):
+            self.assertEqual(v, w)
+            self.assertEqual(hash(v), hash(w))
+        # El vector nulo ya no lanza al hacer hash
+        self.assertEqual(len({Vector([0, 0]), Vector([0.0, 0.0])}), 1)
+
+    def test_hash_ties_in_magnitude(self) -> None:
+        # Componentes empatadas en módulo: el ruido no puede cambiar el hash
+        pairs = [([1.0, -1.0], [-1.0, 1.0 + 1e-12]),
+                 ([2, 1, -2], [-2 + 1e-13, -1, 2])]
+        for a, b in pairs:
+            v, w = Vector(a), Vector(b)
+            self.assertEqual(v, w)
+            self.assertEqual(hash(v), hash(w))
+            self.assertEqual(len({v, w}), 1)
+        # El vector nulo es igual a cualquiera de su dimensión
+        self.assertEqual(hash(Vector([0, 0])), hash(Vector([3.0, -1.0])))
+        self.assertEqual(hash(Vector([1, 2])), hash(Vector([2, 4])))
+
 
 class TestRounding(unittest.TestCase):
     def test_round(self) -> None:
@@ -182,5 +385,34 @@ class TestRounding(unittest.TestCase):
         self.assertAlmostEqual(vr.value[1], 6.79)
 
 
+
+@unittest.skipIf(vector_numba.numba is None, "Numba no está instalado")
+class TestParallelThreads(unittest.TestCase):
+
+    def test_env_parsing(self):
+        """PYHSICS_THREADS malformado o ausente no rompe: se ignora."""
+        top = vector_numba.numba.config.NUMBA_NUM_THREADS
+        for raw, expected in (("abc", None), ("", None), ("1", 1), ("0", 0), ("-2", 0), ("999999", top)):
+            with mock.patch.dict(os.environ, {"PYHSICS_THREADS": raw}):
+                self.assertEqual(vector_numba._parallel_threads(), expected)
+        with mock.patch.dict(os.environ):
+            os.environ.pop("PYHSICS_THREADS", None)
+            self.assertIsNone(vector_numba._parallel_threads())
+
+    def test_limit_is_local_to_the_call(self):
+        """El límite sólo rige durante la llamada: el número de hilos se restaura."""
+        numba = vector_numba.numba
+        before = numba.get_num_threads()
+        seen = []
+        call = vector_numba._limited(lambda a, b: seen.append(numba.get_num_threads()) or 0.0, 1)
+        call(np.ones(3), np.ones(3))
+        self.assertEqual(seen, [1])
+        self.assertEqual(numba.get_num_threads(), before)
+
+    def test_long_dot(self):
+        a = np.linspace(0.0, 1.0, 2 * vector_numba._PARALLEL_MIN_LEN)
+        v = Vector(a.tolist())
+        self.assertAlmostEqual(float(v.dot(v).value), float(a @ a))
+
 if __name__ == "__main__":
     unittest.main()
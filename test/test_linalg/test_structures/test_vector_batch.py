@@ -0,0 +1,50 @@
+# tests/test_vector_batch.py
+import unittest
+
+from pyhsics.linalg.structures import Vector, Point, VectorBatch
+
+
+class TestVectorBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.batch = VectorBatch([[1, 2, 3], [4, 5, 6]])
+
+    def test_shape_and_iter(self) -> None:
+        self.assertEqual(self.batch.shape, (2, 3))
+        self.assertEqual(len(self.batch), 2)
+        self.assertEqual([v.value for v in self.batch], [[1, 2, 3], [4, 5, 6]])
+        self.assertIsInstance(self.batch[1], Vector)
+
+    def test_sub_broadcasts_point(self) -> None:
+        diffs = self.batch - Point([1, 1, 1])
+        self.assertEqual([v.value for v in diffs], [[0, 1, 2], [3, 4, 5]])
+
+    def test_scalar_mul_and_neg(self) -> None:
+        self.assertEqual([v.value for v in self.batch * 2], [[2, 4, 6], [8, 10, 12]])
+        self.assertEqual([v.value for v in -self.batch], [[-1, -2, -3], [-4, -5, -6]])
+
+    def test_dot_and_cross(self) -> None:
+        Vector.set_dot_form(None)
+        other = VectorBatch([[1, 0, 0], [0, 1, 0]])
+        self.assertEqual(self.batch.dot(other).tolist(), [1, 5])
+        self.assertEqual(self.batch.dot(Vector([1, 1, 1])).tolist(), [6, 15])
+        crosses = self.batch.cross(other)
+        expected = [Vector([1, 2, 3]).cross(Vector([1, 0, 0])).value,
+                    Vector([4, 5, 6]).cross(Vector([0, 1, 0])).value]
+        self.assertEqual([v.value for v in crosses], expected)
+        with self.assertRaises(ValueError):
+            VectorBatch([[1, 2]]).cross(VectorBatch([[3, 4]]))
+
+    def test_dot_custom_form(self) -> None:
+        from pyhsics.linalg.structures import Matrix
+        form = Matrix([[2, 0, 0], [0, 3, 0], [0, 0, 1]])
+        res = self.batch.dot(self.batch, form=form)
+        self.assertEqual(res.tolist(), [Vector([1, 2, 3]).dot(Vector([1, 2, 3]), form=form).value,
+                                        Vector([4, 5, 6]).dot(Vector([4, 5, 6]), form=form).value])
+
+    def test_dimension_mismatch(self) -> None:
+        with self.assertRaises(ValueError):
+            self.batch + Vector([1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
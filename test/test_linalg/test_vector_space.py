@@ -0,0 +1,28 @@
+import unittest
+
+from pyhsics.linalg.structures import Vector
+from pyhsics.linalg.spaces.vector_space import VectorSpace
+
+
+class TestVectorSpace(unittest.TestCase):
+    def test_generators_filtered_to_basis(self) -> None:
+        V = VectorSpace(Vector([1, 0, 0]), Vector([2, 0, 0]),
+                        Vector([0, 0, 0]), Vector([0, 1, 0]), Vector([1, 1, 0]))
+        self.assertEqual(V.dimension, 2)
+        self.assertEqual([v.value for v in V.directions], [[1, 0, 0], [0, 1, 0]])
+
+    def test_contains(self) -> None:
+        V = VectorSpace(Vector([1, 0, 0]), Vector([0, 1, 0]))
+        self.assertIn(Vector([3.5, -2, 0]), V)
+        self.assertIn(Vector([0, 0, 0]), V)
+        self.assertNotIn(Vector([0, 0, 1]), V)
+
+    def test_sum_of_spaces(self) -> None:
+        U = VectorSpace(Vector([1, 0, 0]))
+        W = VectorSpace(Vector([0, 1, 0]), Vector([1, 1, 0]))
+        self.assertEqual((U + W).dimension, 2)
+        self.assertEqual(U + W, W)
+
+
+if __name__ == "__main__":
+    unittest.main()
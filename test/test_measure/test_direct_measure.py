@@ -0,0 +1,68 @@
+import random
+import unittest
+import warnings
+
+import numpy as np
+
+from pyhsics.measure import DirectMeasure
+from pyhsics.measure.utils_measure import round_measure, round_measures
+
+
+class TestFromArrays(unittest.TestCase):
+
+    def assertSameMeasures(self, values, errors, units="1"):
+        measures = DirectMeasure.from_arrays(np.array(values), np.array(errors), units)
+        self.assertEqual(len(measures), len(values))
+        for m, v, e in zip(measures, values, errors):
+            expected = DirectMeasure(v, e, units)
+            self.assertEqual(m._rounded, expected._rounded)
+            self.assertEqual([type(x) for x in m._rounded], [type(x) for x in expected._rounded])
+            self.assertEqual((m._real_value, m._real_error), (expected._real_value, expected._real_error))
+            self.assertEqual(m.units, expected.units)
+            self.assertEqual(str(m), str(expected))
+
+    def test_matches_constructor(self):
+        """from_arrays da lo mismo que el constructor en bucle."""
+        rng = random.Random(12345)
+        values = [rng.uniform(-1e4, 1e4) for _ in range(200)]
+        errors = [10 ** rng.uniform(-6, 4) for _ in range(200)]
+        self.assertSameMeasures(values, errors)
+        self.assertSameMeasures(values, errors, "m/s")
+
+    def test_prefixed_units(self):
+        """El prefijo se aplica a valor y error como en el constructor."""
+        self.assertSameMeasures([1.234, 5.5, -0.07], [0.01, 0.3, 0.002], "km")
+        self.assertSameMeasures([12.5, 3.0], [0.25, 1.0], "mm")
+
+    def test_zero_and_boundary_errors(self):
+        """Error nulo (valor sin redondear) y errores que suben de década."""
+        self.assertSameMeasures([3.14159, 2.5, 123.456], [0.0, 0.0, 0.0])
+        self.assertSameMeasures([1.2345, 1.2345, 1.2345, 1.2345], [0.95, 0.096, 9.5e-5, 1e-23])
+
+    def test_broadcast_error(self):
+        """Un único error se reparte entre todos los valores."""
+        measures = DirectMeasure.from_arrays(np.array([1.11, 2.22, 3.33]), np.array(0.1))
+        self.assertEqual([m._rounded for m in measures], [(1.1, 0.1), (2.2, 0.1), (3.3, 0.1)])
+
+    def test_non_finite_errors(self):
+        """inf/nan lanzan lo mismo que el camino escalar, sin avisos de NumPy."""
+        for error, exc in ((np.inf, OverflowError), (-np.inf, OverflowError), (np.nan, ValueError)):
+            with self.assertRaises(exc):
+                DirectMeasure(2.0, error)
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                with self.assertRaises(exc):
+                    DirectMeasure.from_arrays(np.array([1.0, 2.0]), np.array([0.1, error]))
+                with self.assertRaises(exc):
+                    round_measures(np.array([2.0]), np.array([error]))
+
+    def test_round_measures_matches_round_measure(self):
+        rng = random.Random(7)
+        values = [rng.uniform(-1e6, 1e6) for _ in range(500)]
+        errors = [10 ** rng.uniform(-25, 8) for _ in range(500)]
+        self.assertEqual(round_measures(np.array(values), np.array(errors)),
+                         [round_measure(v, e) for v, e in zip(values, errors)])
+
+
+if __name__ == '__main__':
+    unittest.main()
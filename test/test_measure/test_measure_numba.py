@@ -0,0 +1,53 @@
+import math
+import unittest
+
+from pyhsics.measure.measure_numba import _round_error_f64, JIT_MIN_ERROR
+from pyhsics.measure.utils_measure import round_by_error, round_measure, round_significant_error
+
+
+def _round_measure_python(value, error):
+    """Rama de Python puro de round_measure."""
+    error_rounded = round_significant_error(error, 1)
+    value_rounded = round_by_error(value, error_rounded)
+    value_rounded = int(value_rounded) if value_rounded.is_integer() else value_rounded
+    error_rounded = int(error_rounded) if error_rounded.is_integer() else error_rounded
+    return value_rounded, error_rounded
+
+
+# Errores en los bordes: redondeo que sube de década (0.95 → 1, 9.5e-k),
+# los extremos del núcleo (1e-22, 1e22) y empates de round() (0.25, 2.5)
+BOUNDARY_ERRORS = (
+    [0.95, 0.96, 0.949, 9.5, 95, 0.25, 2.5, 1.5, 1.0, 3e-3]
+    + [9.5 * 10.0 ** -k for k in range(1, 23)]
+    + [JIT_MIN_ERROR, 1e-22, 1.0000001e-22, 1e22, 9.5e21, 9.9e22]
+)
+VALUES = [0.0, 1.2345678, -0.987654, 123456.789, 2.5, 1e22, -3.3e-20]
+
+
+@unittest.skipIf(_round_error_f64 is None, "Numba no está instalado")
+class TestRoundErrorKernel(unittest.TestCase):
+
+    def test_kernel_matches_python(self):
+        """El núcleo da el mismo error redondeado y exponente que Python."""
+        for error in BOUNDARY_ERRORS:
+            for e in (error, -error):
+                with self.subTest(error=e):
+                    rounded, exponent = _round_error_f64(e)
+                    expected = round_significant_error(e, 1)
+                    self.assertEqual(rounded, expected)
+                    self.assertEqual(exponent, math.floor(math.log10(abs(expected))))
+
+    def test_round_measure_matches_python(self):
+        """round_measure (vía núcleo) coincide bit a bit con la rama Python."""
+        self.assertEqual(round_measure(1.2345, 0.95), (1, 1))
+        for error in BOUNDARY_ERRORS:
+            for value in VALUES:
+                with self.subTest(value=value, error=error):
+                    result = round_measure(value, error)
+                    expected = _round_measure_python(value, error)
+                    self.assertEqual(result, expected)
+                    self.assertEqual([type(x) for x in result], [type(x) for x in expected])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from math import hypot
+
+from pyhsics.measure import DirectMeasure
+from pyhsics.measure.operator_measure import MeasureAlgebraicOperator
+
+
+class TestMeasureAlgebraicOperator(unittest.TestCase):
+
+    def setUp(self):
+        self.a = DirectMeasure(10, 0.3, "m")
+        self.b = DirectMeasure(20, 0.4, "m")
+
+    def test_sum_uses_second_error(self):
+        """El error de la suma combina los errores, no el valor de b."""
+        result = self.a + self.b
+        self.assertAlmostEqual(result._real_value, 30)
+        self.assertAlmostEqual(result._real_error, 0.5)
+        self.assertEqual(result.error.value, 0.5)
+        self.assertAlmostEqual(MeasureAlgebraicOperator.sum(self.a, self.b)._real_error, 0.5)
+
+    def test_mul_uses_second_error(self):
+        """Error relativo de b = 0.4/20 en el producto."""
+        result = self.a * self.b
+        self.assertAlmostEqual(result._real_value, 200)
+        self.assertAlmostEqual(result._real_error, 200 * hypot(0.3 / 10, 0.4 / 20))
+
+    def test_div_uses_second_error(self):
+        """Error relativo de b = 0.4/20 en el cociente."""
+        result = self.a / self.b
+        self.assertAlmostEqual(result._real_value, 0.5)
+        self.assertAlmostEqual(result._real_error, 0.5 * hypot(0.3 / 10, 0.4 / 20))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+import sympy as sp
+
+from pyhsics.measure import DirectMeasure
+from pyhsics.measure.unit_calculator import UnitCalculator
+from pyhsics.units.fundamental_unit import FundamentalUnit
+from pyhsics.units.unit_composition import UnitComposition
+
+
+class TestUnitCalculator(unittest.TestCase):
+
+    def setUp(self):
+        self.r, self.T, self.a, self.b = sp.symbols("r T a b")
+        self.measurements = {
+            "r": DirectMeasure(2.0, 0.1, "m"),
+            "T": DirectMeasure(4.0, 0.2, "s"),
+            "a": DirectMeasure(1.0, 0.1, "m"),
+            "b": DirectMeasure(3.0, 0.1, "m"),
+        }
+
+    def units(self, expr):
+        return UnitCalculator(expr, self.measurements).compute_total_units()
+
+    def test_numeric_constants_are_dimensionless(self):
+        """pi y sqrt(2) no aportan unidades en un producto."""
+        speed = UnitComposition({FundamentalUnit.DISTANCE: 1, FundamentalUnit.TIME: -1})
+        self.assertEqual(self.units(2 * sp.pi * self.r / self.T), speed)
+        self.assertEqual(self.units(sp.sqrt(2) * self.r), UnitComposition({FundamentalUnit.DISTANCE: 1}))
+        self.assertEqual(self.units(sp.pi * self.r ** 2),
+                         UnitComposition({FundamentalUnit.DISTANCE: 2}))
+
+    def test_add_units(self):
+        """Una suma exige unidades iguales; las constantes son adimensionales."""
+        self.assertEqual(self.units(self.a + self.b), UnitComposition({FundamentalUnit.DISTANCE: 1}))
+        self.assertEqual(self.units(self.a / self.b + sp.pi), UnitComposition({}))
+        with self.assertRaises(ValueError):
+            self.units(self.a + sp.pi)
+        with self.assertRaises(ValueError):
+            self.units(self.a + 1)
+        with self.assertRaises(ValueError):
+            self.units(self.a + self.T)
+
+    def test_functions(self):
+        self.assertEqual(self.units(sp.sin(self.a / self.b)), UnitComposition({}))
+        with self.assertRaises(ValueError):
+            self.units(sp.sin(self.a))
+        with self.assertRaises(NotImplementedError):
+            self.units(sp.Abs(self.a))
+
+    def test_missing_symbol(self):
+        """Un símbolo sin medida lanza ValueError (no KeyError)."""
+        with self.assertRaises(ValueError):
+            self.units(self.a * sp.Symbol("z"))
+
+    def test_subexpressions_memoized(self):
+        """Cada subexpresión se analiza una sola vez."""
+        parsed = []
+
+        class CountingCalculator(UnitCalculator):
+            def _parse(self, expr):
+                parsed.append(expr)
+                return super()._parse(expr)
+
+        shared = self.a + self.b
+        formula = shared * self.r + shared * self.b
+        units = CountingCalculator(formula, self.measurements).compute_total_units()
+        self.assertEqual(units, UnitComposition({FundamentalUnit.DISTANCE: 2}))
+        self.assertEqual(parsed.count(shared), 1)
+        self.assertEqual(parsed.count(self.b), 1)
+
+    def test_dispatch_filled_per_type(self):
+        """La tabla de despacho guarda un manejador por tipo de nodo."""
+        self.units(2 * sp.pi * self.r / self.T)
+        self.assertIs(UnitCalculator._dispatch[sp.Symbol], UnitCalculator._parse_symbol)
+        self.assertIs(UnitCalculator._dispatch[sp.Mul], UnitCalculator._parse_mul)
+        self.assertIs(UnitCalculator._dispatch[sp.Pow], UnitCalculator._parse_pow)
+
+
+if __name__ == '__main__':
+    unittest.main()
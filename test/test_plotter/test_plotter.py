@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+import sympy as sp
+
+from pyhsics.plotter import Plotter
+
+
+class TestPlotterEvaluate(unittest.TestCase):
+
+    def setUp(self):
+        self.x = np.linspace(-3.0, 3.0, 61)
+
+    def lambdified(self, plotter):
+        """Evaluación de referencia con lambdify (camino anterior a Horner)."""
+        sym = sp.symbols(plotter.indep_variable)
+        f = sp.lambdify(sym, plotter.rhs.subs(plotter.subs_dict), 'numpy')
+        return np.broadcast_to(f(self.x), self.x.shape)
+
+    def test_polynomial_uses_polyval(self):
+        """Un polinomio se evalúa con np.polyval y coincide con lambdify."""
+        plotter = Plotter("y = a*x**3 - 2*x**2 + b*x + 5", "x", {"a": 0.5, "b": -1.5})
+        self.assertEqual(plotter._poly_coeffs(plotter.rhs.subs(plotter.subs_dict), sp.Symbol("x")),
+                         [0.5, -2.0, -1.5, 5.0])
+        result = plotter.evaluate(self.x)
+        np.testing.assert_allclose(result, self.lambdified(plotter), rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(result, np.polyval([0.5, -2.0, -1.5, 5.0], self.x))
+
+    def test_non_polynomial_uses_lambdify(self):
+        """Una expresión no polinómica sigue pasando por lambdify."""
+        plotter = Plotter("y = A*sin(x) + x**2", "x", {"A": 2})
+        self.assertIsNone(plotter._poly_coeffs(plotter.rhs.subs(plotter.subs_dict), sp.Symbol("x")))
+        np.testing.assert_allclose(plotter.evaluate(self.x), 2 * np.sin(self.x) + self.x ** 2)
+        np.testing.assert_allclose(plotter.evaluate(self.x), self.lambdified(plotter))
+
+    def test_constant_returns_array(self):
+        """Una expresión constante devuelve un array del tamaño de x_values."""
+        plotter = Plotter("y = 2*pi*c", "x", {"c": 3})
+        result = plotter.evaluate(self.x)
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(result.shape, self.x.shape)
+        np.testing.assert_allclose(result, self.lambdified(plotter))
+        np.testing.assert_allclose(result, np.full(self.x.shape, 6 * np.pi))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
-from pyhsics.units.parser import UnitParser, UnitParseError, alias_resolver
+from pyhsics.units.parser import UnitParser, UnitParseError, alias_resolver, parse_units
+from pyhsics.units.alias_manager import UnitAliasManager
 from pyhsics.units.fundamental_unit import FundamentalUnit
 from pyhsics.units.prefixed_unit import PrefixedUnit
 
@@ -60,5 +61,33 @@ class TestUnitParser(unittest.TestCase):
         result = parser.parse()
         self.assertEqual(result.prefix, 1000)  # Verifica que solo el número se interpreta correctamente
 
+    def test_numeric_factors_fold(self):
+        """Los factores numéricos sólo alteran el prefijo."""
+        result = UnitParser("1000 * m / 4", self.mapping, self.alias_resolver).parse()
+        self.assertEqual(result.prefix, 250)
+        self.assertEqual(result.unit_dict, {FundamentalUnit.DISTANCE: 1})
+
+    def test_parse_units_cache(self):
+        """parse_units memoriza por cadena pero devuelve objetos independientes."""
+        a = parse_units("km/h")
+        b = parse_units("km/h")
+        self.assertIsNot(a, b)
+        self.assertEqual((a.prefix, a.unit_dict), (b.prefix, b.unit_dict))
+        a.unit_dict[FundamentalUnit.MASS] = 1      # no contamina la caché
+        self.assertNotIn(FundamentalUnit.MASS, parse_units("km/h").unit_dict)
+
+    def test_parse_units_alias_invalidation(self):
+        """Un alias nuevo vacía la caché: un fallo previo deja de serlo."""
+        with self.assertRaises(UnitParseError):
+            parse_units("zorp")
+        UnitAliasManager.add_alias({FundamentalUnit.TIME: -2}, "zorp")
+        try:
+            self.assertEqual(parse_units("zorp").unit_dict, {FundamentalUnit.TIME: -2})
+        finally:
+            UnitAliasManager.reset()
+        with self.assertRaises(UnitParseError):
+            parse_units("zorp")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -64,5 +64,17 @@ class TestPrefixedUnit(unittest.TestCase):
         self.assertEqual(prefix, 1e3)
         self.assertEqual(units, self.unit_kg.unit_dict)
 
+    def test_eq_hash_mixed_types(self):
+        """Igualdad y hash coherentes entre PrefixedUnit y UnitComposition."""
+        doubled = PrefixedUnit(2, self.unit_kg)
+        self.assertEqual(doubled, self.unit_kg)
+        self.assertEqual(hash(doubled), hash(self.unit_kg))
+        self.assertEqual(len({doubled, self.unit_kg}), 1)
+        table = {self.unit_kg: "kg"}
+        self.assertEqual(table[doubled], "kg")
+        # Entre PrefixedUnit el prefijo sí cuenta; el hash puede coincidir
+        self.assertNotEqual(self.unit_km, self.unit_mm)
+        self.assertEqual(len({self.unit_km, self.unit_mm}), 2)
+
 if __name__ == '__main__':
     unittest.main()
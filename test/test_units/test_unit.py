@@ -55,6 +55,44 @@ class TestUnit(unittest.TestCase):
         self.assertEqual(result.formula, "kg²·m²·s⁻⁴")
         self.assertEqual(result.prefix, 1.0)
 
+    def test_binop_cache(self):
+        """Los productos repetidos se reutilizan hasta que cambian los alias."""
+        from pyhsics.units.alias_manager import UnitAliasManager
+        m = Unit("m")
+        first = m * m
+        self.assertIs(m * m, first)
+        self.assertEqual(first.formula, "m²")
+        UnitAliasManager.add_alias({FundamentalUnit.DISTANCE: 2}, "sqm")
+        try:
+            self.assertEqual((m * m).formula, "sqm")
+        finally:
+            UnitAliasManager.reset()
+        self.assertEqual((m * m).formula, "m²")
+        self.assertEqual((Unit("2*m") * m).prefix, 2.0)
+
+    def test_from_unit_composition_interned(self):
+        """Composiciones iguales comparten la misma Unit."""
+        from pyhsics.units.unit_composition import UnitComposition
+        a = Unit.from_unit_composition(UnitComposition({FundamentalUnit.TIME: -1}))
+        b = Unit.from_unit_composition(UnitComposition({FundamentalUnit.TIME: -1}))
+        self.assertIs(a, b)
+        self.assertEqual(a, b)
+
+    def test_caches_keep_one_exponent(self):
+        """Composiciones que sólo difieren en ONE no comparten caché."""
+        from pyhsics.units.unit_composition import UnitComposition
+        T, ONE = FundamentalUnit.TIME, FundamentalUnit.ONE
+        plain = UnitComposition({T: -1})
+        with_one = UnitComposition({T: -1, ONE: 1})
+        self.assertNotEqual(plain, with_one)
+        a = Unit.from_unit_composition(plain)
+        b = Unit.from_unit_composition(with_one)
+        self.assertIsNot(a, b)
+        self.assertEqual(a.composition, plain)
+        self.assertEqual(b.composition, with_one)
+        self.assertNotEqual(a * a, b * b)
+        self.assertEqual((b * b).composition, with_one * with_one)
+
     def test_eq(self):
         """Verifica que dos unidades sean iguales."""
         unit1 = Unit(self.unit_kg_m_s)
@@ -20,6 +20,15 @@ class TestUnitComposition(unittest.TestCase):
         unit_com = UnitComposition(self.unit_kg)
         self.assertEqual(unit_com.unit_dict, {FundamentalUnit.MASS: 1})
 
+    def test_canonical_key(self):
+        """La clave ignora ONE y exponentes nulos y se reutiliza entre llamadas."""
+        unit_com = UnitComposition({FundamentalUnit.MASS: 1, FundamentalUnit.ONE: 1})
+        key = unit_com.canonical_key
+        self.assertEqual(key, frozenset({(FundamentalUnit.MASS, 1)}))
+        self.assertIs(unit_com.canonical_key, key)
+        other = UnitComposition({FundamentalUnit.MASS: 1})
+        self.assertIs(other.canonical_key, key)       # clave internada
+
     def test_mul(self):
         """Prueba la multiplicación de composiciones de unidades."""
         unit_com_kg_m = UnitComposition(self.unit_kg_m)
@@ -39,6 +48,16 @@ class TestUnitComposition(unittest.TestCase):
         unit_com_kg_m = UnitComposition(self.unit_kg_m)
         result = unit_com_kg_m ** 2
         self.assertEqual(result.unit_dict, {FundamentalUnit.MASS: 2, FundamentalUnit.DISTANCE: 2})
+        self.assertEqual((unit_com_kg_m ** 0).unit_dict, {})
+        self.assertIs(unit_com_kg_m ** 1, unit_com_kg_m)
+
+    def test_dimensionless_identity(self):
+        """Multiplicar o dividir por la composición adimensional no crea otra."""
+        unit_com_kg_m = UnitComposition(self.unit_kg_m)
+        one = UnitComposition({})
+        self.assertIs(unit_com_kg_m * one, unit_com_kg_m)
+        self.assertIs(one * unit_com_kg_m, unit_com_kg_m)
+        self.assertIs(unit_com_kg_m / one, unit_com_kg_m)
 
     def test_clean(self):
         """Prueba la limpieza de unidades con exponente 0."""
@@ -54,12 +73,31 @@ class TestUnitComposition(unittest.TestCase):
         unit_com_kg_s = UnitComposition(self.unit_kg_s)
         self.assertTrue(unit_com_kg_m == unit_com_kg_m_copy)
         self.assertFalse(unit_com_kg_m == unit_com_kg_s)
+        with_one = UnitComposition({**self.unit_kg_m, FundamentalUnit.ONE: 1})
+        self.assertFalse(unit_com_kg_m == with_one)
+        self.assertTrue(with_one == UnitComposition({**self.unit_kg_m, FundamentalUnit.ONE: 1}))
+
+    def test_hash(self):
+        """Composiciones iguales tienen el mismo hash y sirven como clave."""
+        a = UnitComposition(self.unit_kg_m)
+        b = UnitComposition({FundamentalUnit.DISTANCE: 1, FundamentalUnit.MASS: 1})
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(len({a, b, UnitComposition(self.unit_kg_s)}), 2)
 
     def test_str(self):
         """Prueba la representación en cadena de las composiciones de unidades."""
         unit_com_kg_m = UnitComposition(self.unit_kg_m)
         self.assertEqual(str(unit_com_kg_m), "kg·m")
 
+    def test_str_order(self):
+        """El orden de impresión sigue UNIT_ORDER; lo que queda fuera va al final."""
+        unit_com = UnitComposition({
+            FundamentalUnit.MONEY: 1,
+            FundamentalUnit.TIME: -1,
+            FundamentalUnit.MASS: 1,
+        })
+        self.assertEqual(str(unit_com), "kg·s⁻¹·€")
+
     def test_from_str(self):
         """Prueba la creación de UnitComposition a partir de una cadena."""
         unit_com = UnitComposition.from_str("kg*m/s**2")